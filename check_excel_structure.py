@@ -3,26 +3,88 @@ Script pentru verificarea structurii fișierelor Excel.
 Arată ce sheets, coloane și câte rânduri sunt în fiecare fișier.
 """
 import sys
-import io
 from pathlib import Path
-import pandas as pd
+from openpyxl import load_workbook
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
 
+try:
+    from python_calamine import CalamineWorkbook
+    CALAMINE_AVAILABLE = True
+except ImportError:
+    CALAMINE_AVAILABLE = False
+
 # Fix Windows console encoding
 if sys.platform == 'win32':
-    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
-    sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
+    for stream in (sys.stdout, sys.stderr):
+        # Reconfigured in place; a no-op when UTF-8 is already set (e.g. PYTHONUTF8=1)
+        if stream is not None and stream.encoding.lower().replace('-', '') != 'utf8':
+            stream.reconfigure(encoding='utf-8', errors='replace')
 
 console = Console()
 
 
+def read_sheet_structure(file_path: Path):
+    """
+    Returnează (sheet, rânduri, coloane) pentru fiecare sheet.
+
+    Citește doar dimensiunile și rândul de antet, fără a încărca datele
+    din sheet și fără DataFrame-uri: python-calamine dacă este instalat,
+    altfel openpyxl în mod read-only (.xlsx) sau xlrd cu on_demand (.xls).
+    """
+    if CALAMINE_AVAILABLE:
+        workbook = CalamineWorkbook.from_path(str(file_path))
+        for sheet_name in workbook.sheet_names:
+            sheet = workbook.get_sheet_by_name(sheet_name)
+            header = sheet.to_python(nrows=1)
+            columns = [
+                str(col) if col != "" else f"Unnamed: {i}"
+                for i, col in enumerate(header[0] if header else [])
+            ]
+            yield sheet_name, max(sheet.height - 1, 0), columns
+    elif file_path.suffix.lower() in (".xlsx", ".xlsm"):
+        workbook = load_workbook(file_path, read_only=True)
+        try:
+            for sheet in workbook.worksheets:
+                header = list(next(sheet.iter_rows(values_only=True, max_row=1), ()))
+                # Read-only rows are padded to the sheet width with empty cells
+                while header and header[-1] is None:
+                    header.pop()
+                columns = [
+                    str(col) if col is not None else f"Unnamed: {i}"
+                    for i, col in enumerate(header)
+                ]
+                max_row = sheet.max_row
+                if max_row is None:
+                    # Dimensions missing from the file, count the rows instead
+                    max_row = sum(1 for _ in sheet.iter_rows(values_only=True))
+                yield sheet.title, max(max_row - 1, 0), columns
+        finally:
+            workbook.close()
+    elif file_path.suffix.lower() == ".xls":
+        import xlrd
+
+        workbook = xlrd.open_workbook(str(file_path), on_demand=True)
+        try:
+            for sheet_name in workbook.sheet_names():
+                sheet = workbook.sheet_by_name(sheet_name)
+                header = sheet.row_values(0) if sheet.nrows else []
+                columns = [
+                    str(col) if col != "" else f"Unnamed: {i}"
+                    for i, col in enumerate(header)
+                ]
+                yield sheet_name, max(sheet.nrows - 1, 0), columns
+                workbook.unload_sheet(sheet_name)
+        finally:
+            workbook.release_resources()
+    else:
+        raise ValueError(f"Format nesuportat fără python-calamine: {file_path.suffix}")
+
+
 def check_excel_file(file_path: Path):
     """Verifică structura unui fișier Excel."""
     try:
-        excel = pd.ExcelFile(file_path)
-
         # Panel pentru fișier
         console.print(Panel(
             f"[bold cyan]{file_path.name}[/bold cyan]",
@@ -39,24 +101,22 @@ def check_excel_file(file_path: Path):
         total_sheets = 0
         total_rows = 0
 
-        for sheet_name in excel.sheet_names:
-            df = pd.read_excel(file_path, sheet_name=sheet_name)
-
+        for sheet_name, num_rows, all_columns in read_sheet_structure(file_path):
             # Format coloane
-            if df.empty:
+            if num_rows == 0:
                 columns_str = "[red]EMPTY[/red]"
                 rows_str = "0"
             else:
-                columns = list(df.columns)[:10]  # Primele 10 coloane
-                if len(df.columns) > 10:
-                    columns_str = ", ".join(columns) + f" ... (+{len(df.columns)-10} more)"
+                columns = all_columns[:10]  # Primele 10 coloane
+                if len(all_columns) > 10:
+                    columns_str = ", ".join(columns) + f" ... (+{len(all_columns)-10} more)"
                 else:
                     columns_str = ", ".join(columns)
-                rows_str = str(len(df))
+                rows_str = str(num_rows)
 
             table.add_row(sheet_name, rows_str, columns_str)
             total_sheets += 1
-            total_rows += len(df)
+            total_rows += num_rows
 
         console.print(table)
         console.print(f"[bold]Summary:[/bold] {total_sheets} sheets, {total_rows} total rows\n")
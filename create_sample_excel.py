@@ -4,6 +4,13 @@ Script to create sample Excel files for testing the RAG system.
 import pandas as pd
 from pathlib import Path
 
+# xlsxwriter streams rows to disk in constant_memory mode; openpyxl is the fallback
+try:
+    import xlsxwriter
+    XLSXWRITER_AVAILABLE = True
+except ImportError:
+    XLSXWRITER_AVAILABLE = False
+
 def create_sample_data():
     """Create sample data for testing."""
 
@@ -128,6 +135,29 @@ def create_sample_data():
     return suppliers_renewable, suppliers_conventional, large_consumers
 
 
+def write_excel_file(file_path: Path, sheets: dict):
+    """Write DataFrames to one Excel file, one sheet per entry."""
+    if XLSXWRITER_AVAILABLE:
+        # constant_memory flushes each row once the next one starts, so rows
+        # must be written in order (pandas' ExcelWriter writes column by column)
+        workbook = xlsxwriter.Workbook(str(file_path), {"constant_memory": True})
+        try:
+            for sheet_name, df in sheets.items():
+                worksheet = workbook.add_worksheet(sheet_name)
+                worksheet.write_row(0, 0, [str(col) for col in df.columns])
+                values = df.astype(object).where(df.notna(), None)
+                for row_idx, row in enumerate(values.itertuples(index=False, name=None), start=1):
+                    worksheet.write_row(row_idx, 0, row)
+        finally:
+            workbook.close()
+    else:
+        with pd.ExcelWriter(file_path, engine="openpyxl") as writer:
+            for sheet_name, df in sheets.items():
+                df.to_excel(writer, sheet_name=sheet_name, index=False)
+
+    print(f"✓ Created: {file_path}")
+
+
 def create_excel_files():
     """Create sample Excel files."""
 
@@ -138,42 +168,38 @@ def create_excel_files():
     # Get sample data
     renewable, conventional, consumers = create_sample_data()
 
-    # Create first Excel file - Renewable energy suppliers
-    file1 = data_dir / "furnizori_energie_regenerabila.xlsx"
-    with pd.ExcelWriter(file1, engine='openpyxl') as writer:
-        df_renewable = pd.DataFrame(renewable)
-        df_renewable.to_excel(writer, sheet_name='Energie Regenerabila', index=False)
+    # Build each DataFrame once and reuse it for the combined file
+    df_renewable = pd.DataFrame(renewable)
+    df_conventional = pd.DataFrame(conventional)
+    df_consumers = pd.DataFrame(consumers)
 
-    print(f"✓ Created: {file1}")
+    # Create first Excel file - Renewable energy suppliers
+    write_excel_file(
+        data_dir / "furnizori_energie_regenerabila.xlsx",
+        {'Energie Regenerabila': df_renewable}
+    )
 
     # Create second Excel file - Conventional energy
-    file2 = data_dir / "furnizori_energie_conventionala.xlsx"
-    with pd.ExcelWriter(file2, engine='openpyxl') as writer:
-        df_conventional = pd.DataFrame(conventional)
-        df_conventional.to_excel(writer, sheet_name='Energie Conventionala', index=False)
-
-    print(f"✓ Created: {file2}")
+    write_excel_file(
+        data_dir / "furnizori_energie_conventionala.xlsx",
+        {'Energie Conventionala': df_conventional}
+    )
 
     # Create third Excel file - Large consumers
-    file3 = data_dir / "consumatori_mari.xlsx"
-    with pd.ExcelWriter(file3, engine='openpyxl') as writer:
-        df_consumers = pd.DataFrame(consumers)
-        df_consumers.to_excel(writer, sheet_name='Consumatori', index=False)
-
-    print(f"✓ Created: {file3}")
+    write_excel_file(
+        data_dir / "consumatori_mari.xlsx",
+        {'Consumatori': df_consumers}
+    )
 
     # Create combined file with multiple sheets
-    file4 = data_dir / "date_complete_energie_2024.xlsx"
-    with pd.ExcelWriter(file4, engine='openpyxl') as writer:
-        df_renewable = pd.DataFrame(renewable)
-        df_conventional = pd.DataFrame(conventional)
-        df_consumers = pd.DataFrame(consumers)
-
-        df_renewable.to_excel(writer, sheet_name='Furnizori Regenerabili', index=False)
-        df_conventional.to_excel(writer, sheet_name='Furnizori Conventionali', index=False)
-        df_consumers.to_excel(writer, sheet_name='Consumatori Mari', index=False)
-
-    print(f"✓ Created: {file4}")
+    write_excel_file(
+        data_dir / "date_complete_energie_2024.xlsx",
+        {
+            'Furnizori Regenerabili': df_renewable,
+            'Furnizori Conventionali': df_conventional,
+            'Consumatori Mari': df_consumers,
+        }
+    )
 
     print(f"\n✓ Successfully created {4} sample Excel files in {data_dir}")
     print("\nSample data includes:")
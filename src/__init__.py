@@ -2,25 +2,37 @@
 RAG System for Energy Sector Data Analysis.
 """
 
+import importlib
+
 __version__ = "1.0.0"
 
-from .rag_system import RAGSystem
-from .data_loader import ExcelDataLoader
-from .embeddings import EmbeddingsGenerator, ChromaDBEmbeddings
-from .retriever import FAISSRetriever, HybridRetriever
-from .generator import AnswerGenerator, PromptLoader, ReportGenerator
-from .utils import setup_logging, load_config
-
-__all__ = [
-    "RAGSystem",
-    "ExcelDataLoader",
-    "EmbeddingsGenerator",
-    "ChromaDBEmbeddings",
-    "FAISSRetriever",
-    "HybridRetriever",
-    "AnswerGenerator",
-    "PromptLoader",
-    "ReportGenerator",
-    "setup_logging",
-    "load_config",
-]
+# Public names and the submodules defining them; imported on first access
+# so that e.g. the CLI does not load torch/FAISS just to print its help
+_LAZY_EXPORTS = {
+    "RAGSystem": ".rag_system",
+    "ExcelDataLoader": ".data_loader",
+    "EmbeddingsGenerator": ".embeddings",
+    "ChromaDBEmbeddings": ".embeddings",
+    "FaissEmbeddings": ".embeddings",
+    "FAISSRetriever": ".retriever",
+    "HybridRetriever": ".retriever",
+    "AnswerGenerator": ".generator",
+    "PromptLoader": ".generator",
+    "ReportGenerator": ".generator",
+    "setup_logging": ".utils",
+    "load_config": ".utils",
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        value = getattr(importlib.import_module(_LAZY_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -0,0 +1,7 @@
+"""
+CLI subcommands, imported on demand by the LazyGroup in src/main.py.
+
+Each module defines one click command named ``cmd``. Heavy dependencies
+(RAGSystem, rich) are imported inside the command functions, so listing
+commands with --help stays cheap.
+"""
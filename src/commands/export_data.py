@@ -0,0 +1,68 @@
+"""
+Export command: load Excel files and export the records.
+"""
+import sys
+from pathlib import Path
+
+import click
+from loguru import logger
+
+from ..utils import load_config
+
+
+@click.command(name="export-data")
+@click.option('--input-dir', default='./data/input', help='Directory with Excel files')
+@click.option('--output', '-o', help='Output file path (JSON or Parquet)')
+@click.option('--num-workers', type=int, default=None, help='Worker processes for loading files (default: CPU count)')
+@click.option('--no-cache', is_flag=True, help='Re-parse all Excel files instead of reusing cached records')
+@click.pass_context
+def cmd(ctx, input_dir, output, num_workers, no_cache):
+    """
+    Export loaded data to JSON or Parquet.
+
+    Exporta datele incarcate in format JSON sau Parquet.
+    """
+    from rich.console import Console
+
+    console = Console()
+    console.print("\n[bold blue]Exporting Data[/bold blue]\n")
+
+    try:
+        from ..data_loader import ExcelDataLoader
+
+        # Load config
+        config = load_config(ctx.obj['config_path'])
+        column_mappings = config.get("excel", {}).get("column_mappings")
+        use_cache = not no_cache and config.get("data", {}).get("use_cache", True)
+
+        # Initialize loader
+        loader = ExcelDataLoader(input_dir, column_mappings=column_mappings)
+
+        # Load data
+        with console.status("[bold green]Loading Excel files..."):
+            records = loader.load_all_files(max_workers=num_workers, use_cache=use_cache)
+
+        console.print(f"[green]✓[/green] Loaded {len(records)} records\n")
+
+        # Export
+        if output:
+            ext = Path(output).suffix.lower()
+
+            if ext == '.json':
+                loader.export_to_json(output)
+            elif ext == '.parquet':
+                loader.export_to_parquet(output)
+            else:
+                console.print("[red]Unsupported format. Use .json or .parquet[/red]")
+                sys.exit(1)
+
+            console.print(f"[green]✓[/green] Data exported to: {output}")
+        else:
+            # Show sample data
+            df = loader.to_dataframe()
+            console.print(df.head(10))
+
+    except Exception as e:
+        console.print(f"[red]✗ Error:[/red] {str(e)}")
+        logger.exception("Export failed")
+        sys.exit(1)
@@ -0,0 +1,70 @@
+"""
+Report command: search and write a markdown report.
+"""
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import click
+from loguru import logger
+
+
+@click.command(name="generate-report")
+@click.option('--query', '-q', required=True, help='Search query for report')
+@click.option('--output', '-o', required=True, help='Output file path (timestamp will be added automatically)')
+@click.option('--embeddings-dir', default='./embeddings', help='Directory with embeddings')
+@click.option('--prompts-dir', default='./prompts', help='Directory with prompts')
+@click.option('--format', type=click.Choice(['markdown', 'md']), default='markdown', help='Output format')
+@click.option('--include-summary', is_flag=True, help='Include LLM-generated summary')
+@click.option('--no-timestamp', is_flag=True, help='Disable automatic timestamp in filename')
+@click.pass_context
+def cmd(ctx, query, output, embeddings_dir, prompts_dir, format, include_summary, no_timestamp):
+    """
+    Generate a comprehensive report.
+
+    Genereaza un raport detaliat pentru o cautare.
+    """
+    from rich.console import Console
+    from ..rag_system import RAGSystem
+
+    console = Console()
+
+    # Add timestamp to filename unless disabled
+    if not no_timestamp:
+        output_path = Path(output)
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        # Insert timestamp before extension
+        new_name = f"{timestamp}_{output_path.stem}{output_path.suffix}"
+        output = str(output_path.parent / new_name)
+
+    console.print(f"\n[bold blue]Generating Report[/bold blue]\n")
+    console.print(f"Query: {query}")
+    console.print(f"Output: {output}\n")
+
+    try:
+        # Initialize RAG system
+        rag = RAGSystem(
+            prompts_dir=prompts_dir,
+            embeddings_dir=embeddings_dir,
+            config_path=ctx.obj['config_path']
+        )
+
+        # Initialize components
+        with console.status("[bold green]Loading system..."):
+            rag.initialize_components()
+            rag.load_index()
+
+        # Generate report
+        with console.status("[bold yellow]Generating report..."):
+            rag.save_report(
+                query,
+                output,
+                include_summary=include_summary
+            )
+
+        console.print(f"\n[green]✓[/green] Report saved to: {output}")
+
+    except Exception as e:
+        console.print(f"[red]✗ Error:[/red] {str(e)}")
+        logger.exception("Report generation failed")
+        sys.exit(1)
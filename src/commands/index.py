@@ -0,0 +1,76 @@
+"""
+Index command: load Excel files and build the search index.
+"""
+import sys
+
+import click
+from loguru import logger
+
+
+@click.command(name="index")
+@click.option('--input-dir', default='./data/input', help='Directory with Excel files')
+@click.option('--embeddings-dir', default='./embeddings', help='Directory for embeddings')
+@click.option('--prompts-dir', default='./prompts', help='Directory with prompts')
+@click.option('--embedding-model', default=None, help='Embedding model name')
+@click.option('--force', is_flag=True, help='Force reindexing')
+@click.option('--num-workers', type=int, default=None, help='Worker processes for loading files (default: CPU count)')
+@click.option('--no-cache', is_flag=True, help='Re-parse all Excel files instead of reusing cached records')
+@click.pass_context
+def cmd(ctx, input_dir, embeddings_dir, prompts_dir, embedding_model, force, num_workers, no_cache):
+    """
+    Index Excel documents for search.
+
+    Incarca si indexeaza toate fisierele Excel din directorul specificat.
+    """
+    from rich.console import Console
+    from rich.table import Table
+    from ..rag_system import RAGSystem
+
+    console = Console()
+    console.print("\n[bold blue]Indexing Documents[/bold blue]\n")
+
+    try:
+        # Initialize RAG system
+        rag = RAGSystem(
+            input_dir=input_dir,
+            prompts_dir=prompts_dir,
+            embeddings_dir=embeddings_dir,
+            config_path=ctx.obj['config_path']
+        )
+
+        # Initialize components
+        with console.status("[bold green]Initializing components..."):
+            rag.initialize_components(embedding_model=embedding_model)
+
+        console.print("[green]✓[/green] Components initialized\n")
+
+        # Index documents
+        console.print("[yellow]Loading and indexing documents...[/yellow]")
+        num_docs = rag.index_documents(
+            force_reindex=force,
+            num_workers=num_workers,
+            use_cache=False if no_cache else None
+        )
+
+        console.print(f"\n[green]✓[/green] Successfully indexed [bold]{num_docs}[/bold] documents")
+
+        # Show statistics
+        stats = rag.get_statistics()
+
+        table = Table(title="Index Statistics")
+        table.add_column("Metric", style="cyan")
+        table.add_column("Value", style="green")
+
+        for key, value in stats.items():
+            if isinstance(value, dict):
+                for sub_key, sub_value in value.items():
+                    table.add_row(f"{key}.{sub_key}", str(sub_value))
+            else:
+                table.add_row(key, str(value))
+
+        console.print(table)
+
+    except Exception as e:
+        console.print(f"[red]✗ Error:[/red] {str(e)}")
+        logger.exception("Indexing failed")
+        sys.exit(1)
@@ -0,0 +1,47 @@
+"""
+Interactive command: run a search session in the terminal.
+"""
+import sys
+
+import click
+from loguru import logger
+
+
+@click.command(name="interactive")
+@click.option('--embeddings-dir', default='./embeddings', help='Directory with embeddings')
+@click.option('--prompts-dir', default='./prompts', help='Directory with prompts')
+@click.option('--top-k', default=5, help='Number of results per query')
+@click.pass_context
+def cmd(ctx, embeddings_dir, prompts_dir, top_k):
+    """
+    Start interactive search session.
+
+    Porneste o sesiune interactiva de cautare.
+    """
+    from rich.console import Console
+    from ..rag_system import RAGSystem
+
+    console = Console()
+
+    try:
+        # Initialize RAG system
+        rag = RAGSystem(
+            prompts_dir=prompts_dir,
+            embeddings_dir=embeddings_dir,
+            config_path=ctx.obj['config_path']
+        )
+
+        # Initialize components
+        with console.status("[bold green]Loading system..."):
+            rag.initialize_components()
+            rag.load_index()
+
+        console.print("[green]✓[/green] System ready\n")
+
+        # Start interactive session
+        rag.interactive_search()
+
+    except Exception as e:
+        console.print(f"[red]✗ Error:[/red] {str(e)}")
+        logger.exception("Interactive session failed")
+        sys.exit(1)
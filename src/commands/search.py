@@ -0,0 +1,91 @@
+"""
+Search command: answer a single query from the index.
+"""
+import sys
+
+import click
+from loguru import logger
+
+
+@click.command(name="search")
+@click.option('--query', '-q', required=True, help='Search query')
+@click.option('--embeddings-dir', default='./embeddings', help='Directory with embeddings')
+@click.option('--prompts-dir', default='./prompts', help='Directory with prompts')
+@click.option('--top-k', default=5, help='Number of results to return')
+@click.option('--no-llm', is_flag=True, help='Skip LLM generation, show only search results')
+@click.option('--address', default=None, help='Socket address of a serve daemon (default: per-user socket)')
+@click.pass_context
+def cmd(ctx, query, embeddings_dir, prompts_dir, top_k, no_llm, address):
+    """
+    Search for documents matching a query.
+
+    Cauta documente relevante pentru o intrebare data.
+    """
+    from rich.console import Console
+    from ..rag_system import RAGSystem
+    from .serve import send_request
+
+    console = Console()
+    console.print(f"\n[bold blue]Searching:[/bold blue] {query}\n")
+
+    try:
+        # Use a running `serve` daemon if there is one
+        response = send_request(
+            embeddings_dir,
+            "search" if no_llm else "query",
+            address=address,
+            query=query,
+            top_k=top_k
+        )
+
+        if response is None:
+            # Initialize RAG system
+            rag = RAGSystem(
+                prompts_dir=prompts_dir,
+                embeddings_dir=embeddings_dir,
+                config_path=ctx.obj['config_path']
+            )
+
+            # Initialize components
+            with console.status("[bold green]Loading system..."):
+                rag.initialize_components()
+                rag.load_index()
+
+            response = rag.search(query, top_k=top_k) if no_llm else rag.query(query, top_k=top_k)
+
+        if no_llm:
+            results = response
+
+            # Display results, rendered in one print call
+            lines = []
+            for i, result in enumerate(results, 1):
+                metadata = result["metadata"]
+                score = result.get("score", 0)
+
+                lines.append(f"\n[bold cyan]{i}. {metadata.get('client_name', 'N/A')}[/bold cyan] (Score: {score:.3f})")
+
+                source_type = metadata.get("source_type")
+                if source_type:
+                    lines.append(f"   [green]Sursa:[/green] {source_type}")
+
+                power_installed = metadata.get("power_installed")
+                if power_installed:
+                    lines.append(f"   [green]Putere:[/green] {power_installed} MW")
+
+                address = metadata.get("address")
+                if address:
+                    lines.append(f"   [green]Locatie:[/green] {address}")
+
+            if lines:
+                console.print("\n".join(lines))
+        else:
+            # Full RAG query with LLM
+            answer = response
+
+            console.print("\n[bold green]Answer:[/bold green]\n")
+            console.print(answer)
+
+    except Exception as e:
+        console.print(f"[red]✗ Error:[/red] {str(e)}")
+        logger.exception("Search failed")
+        sys.exit(1)
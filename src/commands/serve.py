@@ -0,0 +1,345 @@
+"""
+Serve command: keep the model and index loaded for other CLI commands.
+
+The daemon listens on a local socket (a named pipe on Windows) in a
+directory only the current user can access. The search and stats commands
+try it first through send_request and only load the model and index
+themselves when no daemon serves their embeddings directory.
+
+Connections are authenticated with a random key the daemon writes next to
+the socket (readable only by the user), so neither side unpickles data
+from a peer that does not hold the key. The daemon answers one client at a
+time and drops clients that stall for longer than CLIENT_TIMEOUT.
+"""
+import getpass
+import os
+import stat
+import sys
+import tempfile
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Client, Connection, Listener, answer_challenge, deliver_challenge
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import click
+from loguru import logger
+
+# Seconds the daemon waits for each message from a connected client
+CLIENT_TIMEOUT = 10.0
+
+
+def _runtime_dir() -> Path:
+    """
+    Get the per-user directory holding the daemon socket and key.
+
+    Returns:
+        $XDG_RUNTIME_DIR, or a 0700 excel-rag-<uid> directory in the temp dir
+
+    Raises:
+        RuntimeError: If the directory is owned by another user or accessible to others
+    """
+    if sys.platform == 'win32':
+        # The Windows temp directory is already per-user
+        return Path(tempfile.gettempdir())
+
+    runtime_dir = os.environ.get('XDG_RUNTIME_DIR')
+    if runtime_dir and os.path.isdir(runtime_dir):
+        path = Path(runtime_dir)
+    else:
+        path = Path(tempfile.gettempdir()) / f'excel-rag-{os.getuid()}'
+        path.mkdir(mode=0o700, exist_ok=True)
+
+    info = path.lstat()
+    if not stat.S_ISDIR(info.st_mode) or info.st_uid != os.getuid() or info.st_mode & 0o077:
+        raise RuntimeError(f"Refusing to use {path}: not a private directory owned by the current user")
+    return path
+
+
+def default_address() -> str:
+    """
+    Get the default daemon address for the current user.
+
+    Returns:
+        Named pipe name on Windows, socket path elsewhere
+    """
+    if sys.platform == 'win32':
+        return rf'\\.\pipe\excel-rag-{getpass.getuser()}'
+    return str(_runtime_dir() / 'excel-rag.sock')
+
+
+def _authkey_path(address: str) -> Path:
+    """
+    Get the path of the key file for a daemon address.
+
+    Args:
+        address: Socket address of the daemon
+
+    Returns:
+        Key file path, next to the socket (in the runtime directory for pipes)
+    """
+    if sys.platform == 'win32':
+        return _runtime_dir() / (address.rsplit('\\', 1)[-1] + '.key')
+    return Path(address + '.key')
+
+
+def _read_authkey(address: str) -> Optional[bytes]:
+    """
+    Read the key of the daemon at an address.
+
+    Args:
+        address: Socket address of the daemon
+
+    Returns:
+        The key, or None if there is no key file or it is not private to the user
+    """
+    key_file = _authkey_path(address)
+    try:
+        with open(key_file, 'rb') as f:
+            if sys.platform != 'win32':
+                info = os.fstat(f.fileno())
+                if info.st_uid != os.getuid() or info.st_mode & 0o077:
+                    logger.warning(f"Ignoring daemon key {key_file}: not private to the current user")
+                    return None
+            return f.read()
+    except OSError:
+        return None
+
+
+def _write_authkey(address: str) -> bytes:
+    """
+    Create a new random key for a daemon address, readable only by the user.
+
+    Args:
+        address: Socket address of the daemon
+
+    Returns:
+        The key
+    """
+    key = os.urandom(32)
+    key_file = _authkey_path(address)
+    # A fresh file, so an existing one with other permissions is not reused
+    key_file.unlink(missing_ok=True)
+    fd = os.open(key_file, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    with os.fdopen(fd, 'wb') as f:
+        f.write(key)
+    return key
+
+
+def send_request(embeddings_dir: str, command: str, address: Optional[str] = None, **kwargs) -> Optional[Any]:
+    """
+    Run a command on the serve daemon.
+
+    Args:
+        embeddings_dir: Embeddings directory the caller wants to use
+        command: Daemon command ("search", "query" or "stats")
+        address: Socket address of the daemon (default: default_address())
+        **kwargs: Command arguments
+
+    Returns:
+        The command result, or None if no daemon serves embeddings_dir
+
+    Raises:
+        RuntimeError: If the command failed inside the daemon
+    """
+    try:
+        address = address or default_address()
+    except (OSError, RuntimeError) as e:
+        logger.debug(f"Not using daemon: {e}")
+        return None
+
+    if sys.platform != 'win32' and not os.path.exists(address):
+        return None
+
+    authkey = _read_authkey(address)
+    if authkey is None:
+        return None
+
+    request = {"command": command, "embeddings_dir": str(Path(embeddings_dir).resolve()), **kwargs}
+    try:
+        # The key handshake runs before anything is unpickled
+        with Client(address, authkey=authkey) as conn:
+            conn.send(request)
+            response = conn.recv()
+    except (OSError, EOFError, AuthenticationError):
+        return None
+
+    if response["status"] == "error":
+        raise RuntimeError(response["error"])
+    if response["status"] != "ok":
+        return None
+
+    logger.debug("Served {} request from daemon at {}", command, address)
+    return response["result"]
+
+
+def _handle_request(rag, embeddings_dir: str, request: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Run one client request against the loaded RAG system.
+
+    Args:
+        rag: Initialized RAG system with its index loaded
+        embeddings_dir: Resolved embeddings directory served by the daemon
+        request: Request dictionary from send_request
+
+    Returns:
+        Response dictionary with a status and the result or error message
+    """
+    if request.get("embeddings_dir") != embeddings_dir:
+        return {"status": "mismatch"}
+
+    command = request.get("command")
+    try:
+        if command == "search":
+            result = rag.search(request["query"], top_k=request.get("top_k"))
+        elif command == "query":
+            result = rag.query(request["query"], top_k=request.get("top_k"))
+        elif command == "stats":
+            result = rag.get_statistics()
+        else:
+            raise ValueError(f"Unknown command: {command}")
+    except Exception as e:
+        logger.exception(f"Request {command} failed")
+        return {"status": "error", "error": str(e)}
+
+    return {"status": "ok", "result": result}
+
+
+class _TimeoutConnection:
+    """
+    Connection wrapper whose receives give up after a timeout.
+    """
+
+    def __init__(self, conn: Connection, timeout: float):
+        """
+        Initialize wrapper.
+
+        Args:
+            conn: Accepted client connection
+            timeout: Seconds to wait for each message
+        """
+        self._conn = conn
+        self._timeout = timeout
+
+    def send_bytes(self, buf: bytes):
+        """Send a message."""
+        self._conn.send_bytes(buf)
+
+    def recv_bytes(self, maxlength: Optional[int] = None) -> bytes:
+        """
+        Receive a message.
+
+        Raises:
+            TimeoutError: If no message arrives within the timeout
+        """
+        if not self._conn.poll(self._timeout):
+            raise TimeoutError(f"No message from client within {self._timeout}s")
+        return self._conn.recv_bytes(maxlength)
+
+    def recv(self) -> Any:
+        """
+        Receive and unpickle an object.
+
+        Raises:
+            TimeoutError: If no message arrives within the timeout
+        """
+        if not self._conn.poll(self._timeout):
+            raise TimeoutError(f"No message from client within {self._timeout}s")
+        return self._conn.recv()
+
+
+def _serve(listener: Listener, authkey: bytes, rag, embeddings_dir: str):
+    """
+    Answer client requests one at a time until interrupted.
+
+    The listener is created without a key and the handshake is done here,
+    so a client that connects and then stalls only holds up the daemon for
+    CLIENT_TIMEOUT instead of blocking accept() for good.
+
+    Args:
+        listener: Listener bound to the daemon address
+        authkey: Key clients must prove they hold
+        rag: Initialized RAG system with its index loaded
+        embeddings_dir: Resolved embeddings directory served by the daemon
+    """
+    while True:
+        try:
+            conn = listener.accept()
+        except OSError as e:
+            logger.warning(f"Could not accept client connection: {e}")
+            continue
+
+        with conn:
+            client = _TimeoutConnection(conn, CLIENT_TIMEOUT)
+            try:
+                # The same handshake Listener does for an authkey, before anything is unpickled
+                deliver_challenge(client, authkey)
+                answer_challenge(client, authkey)
+                conn.send(_handle_request(rag, embeddings_dir, client.recv()))
+            except (AuthenticationError, EOFError, OSError) as e:
+                logger.warning(f"Client connection failed: {e}")
+
+
+@click.command(name="serve")
+@click.option('--embeddings-dir', default='./embeddings', help='Directory with embeddings')
+@click.option('--prompts-dir', default='./prompts', help='Directory with prompts')
+@click.option('--address', default=None, help='Socket address to listen on (default: per-user socket)')
+@click.pass_context
+def cmd(ctx, embeddings_dir, prompts_dir, address):
+    """
+    Keep the model and index loaded for search and stats.
+
+    Pastreaza modelul si indexul incarcate pentru comenzile search si stats.
+    """
+    from rich.console import Console
+    from ..rag_system import RAGSystem
+
+    console = Console()
+
+    try:
+        address = address or default_address()
+
+        if sys.platform != 'win32' and os.path.exists(address):
+            try:
+                Client(address).close()
+            except OSError:
+                # Left behind by a daemon that did not shut down cleanly
+                os.unlink(address)
+            else:
+                console.print(f"[red]✗ Error:[/red] A daemon is already listening on {address}")
+                sys.exit(1)
+
+        # Initialize RAG system
+        rag = RAGSystem(
+            prompts_dir=prompts_dir,
+            embeddings_dir=embeddings_dir,
+            config_path=ctx.obj['config_path']
+        )
+
+        with console.status("[bold green]Loading system..."):
+            rag.initialize_components()
+            rag.load_index()
+
+        served_dir = str(Path(embeddings_dir).resolve())
+
+        # Socket and key only accessible to the current user
+        old_umask = os.umask(0o077)
+        try:
+            authkey = _write_authkey(address)
+            listener = Listener(address)
+        finally:
+            os.umask(old_umask)
+
+        console.print(f"[green]✓[/green] Serving {served_dir} on {address} (Ctrl+C to stop)\n")
+
+        with listener:
+            try:
+                _serve(listener, authkey, rag, served_dir)
+            finally:
+                _authkey_path(address).unlink(missing_ok=True)
+
+    except KeyboardInterrupt:
+        console.print("\nDaemon stopped")
+    except Exception as e:
+        console.print(f"[red]✗ Error:[/red] {str(e)}")
+        logger.exception("Serve failed")
+        sys.exit(1)
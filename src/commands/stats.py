@@ -0,0 +1,66 @@
+"""
+Stats command: show index and data statistics.
+"""
+import sys
+
+import click
+from loguru import logger
+
+
+@click.command(name="stats")
+@click.option('--embeddings-dir', default='./embeddings', help='Directory with embeddings')
+@click.option('--address', default=None, help='Socket address of a serve daemon (default: per-user socket)')
+@click.pass_context
+def cmd(ctx, embeddings_dir, address):
+    """
+    Show system statistics.
+
+    Afiseaza statistici despre sistemul RAG.
+    """
+    from rich.console import Console
+    from rich.table import Table
+    from ..rag_system import RAGSystem
+    from .serve import send_request
+
+    console = Console()
+    console.print("\n[bold blue]System Statistics[/bold blue]\n")
+
+    try:
+        # Use a running `serve` daemon if there is one
+        statistics = send_request(embeddings_dir, "stats", address=address)
+
+        if statistics is None:
+            # Initialize RAG system
+            rag = RAGSystem(
+                embeddings_dir=embeddings_dir,
+                config_path=ctx.obj['config_path']
+            )
+
+            # Initialize components
+            with console.status("[bold green]Loading system..."):
+                rag.initialize_components()
+                rag.load_index()
+
+            # Get statistics
+            statistics = rag.get_statistics()
+
+        # Display in table
+        table = Table(title="RAG System Statistics")
+        table.add_column("Metric", style="cyan", no_wrap=True)
+        table.add_column("Value", style="green")
+
+        for key, value in statistics.items():
+            if isinstance(value, dict):
+                # Add header for nested dict
+                table.add_row(f"[bold]{key}[/bold]", "")
+                for sub_key, sub_value in value.items():
+                    table.add_row(f"  {sub_key}", str(sub_value))
+            else:
+                table.add_row(key, str(value))
+
+        console.print(table)
+
+    except Exception as e:
+        console.print(f"[red]✗ Error:[/red] {str(e)}")
+        logger.exception("Stats retrieval failed")
+        sys.exit(1)
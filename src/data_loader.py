@@ -1,11 +1,37 @@
 """
 Data loader module for reading and processing Excel files.
 """
+import hashlib
+import json
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from fnmatch import fnmatch
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Tuple, Iterator
+import numpy as np
 import pandas as pd
 from loguru import logger
-from pydantic import BaseModel, Field
+from openpyxl import load_workbook
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
+
+try:
+    import python_calamine  # noqa: F401
+    CALAMINE_AVAILABLE = True
+except ImportError:
+    CALAMINE_AVAILABLE = False
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 
 class EnergyRecord(BaseModel):
@@ -23,11 +49,23 @@ class EnergyRecord(BaseModel):
     row_number: int = Field(default=0)
 
 
+_ENERGY_RECORDS_ADAPTER = TypeAdapter(List[EnergyRecord])
+
+# Below this many files, worker start-up costs more than parallel parsing saves
+_MIN_FILES_FOR_WORKERS = 4
+
+
 class ExcelDataLoader:
     """
     Loads and processes Excel files containing energy sector data.
     """
 
+    # Bump when record extraction changes, so cached records from older versions are not reused
+    CACHE_VERSION = 1
+
+    # pandas options for reading sheets as text (see _read_sheet)
+    READ_OPTIONS = {"dtype": str, "na_filter": False, "keep_default_na": False}
+
     def __init__(self, input_dir: str, column_mappings: Optional[Dict[str, List[str]]] = None):
         """
         Initialize the data loader.
@@ -41,6 +79,19 @@ class ExcelDataLoader:
         self.column_mappings = column_mappings  # Can be None for unstructured mode
         self.loaded_data: List[Dict[str, Any]] = []
 
+        # Alias lookup structures, rebuilt only when column_mappings changes
+        self._alias_lower: Dict[str, List[str]] = {}
+        self._automaton = None
+        self._indexed_mappings: Optional[Dict[str, List[str]]] = None
+
+        # Parsed records per unchanged source file, see load_all_files
+        self._cache_dir = self.input_dir.parent / "cache"
+
+        # Detected column maps per header tuple, so sheets sharing a layout are matched once
+        self._schema_cache: Dict[Tuple[Any, ...], Dict[str, Any]] = {}
+
+        self._build_alias_index()
+
         # Log mode
         if self.column_mappings is None:
             logger.info("ExcelDataLoader initialized in UNSTRUCTURED mode (all columns will be indexed)")
@@ -69,40 +120,154 @@ class ExcelDataLoader:
             patterns: List of file patterns to match (default: ["*.xlsx", "*.xls"])
 
         Returns:
-            List of Path objects for Excel files
+            List of Path objects for Excel files, without hidden files
+            such as macOS "._" resource forks
         """
         if patterns is None:
             patterns = ["*.xlsx", "*.xls"]
 
+        if not self.input_dir.is_dir():
+            logger.warning(f"Input directory not found: {self.input_dir}")
+            return []
+
+        # Patterns reaching into subdirectories ("sub/*.xlsx", "**/*.xlsx") need a real glob
+        nested_patterns = [p for p in patterns if "/" in p or "**" in p]
+        name_patterns = [p for p in patterns if p not in nested_patterns]
+
+        # One directory scan matched against all name patterns, instead of one glob per pattern
         excel_files = []
-        for pattern in patterns:
-            excel_files.extend(self.input_dir.glob(pattern))
+        if name_patterns:
+            with os.scandir(self.input_dir) as entries:
+                excel_files = [
+                    Path(entry.path)
+                    for entry in entries
+                    if not entry.name.startswith(".")
+                    and entry.is_file()
+                    and any(fnmatch(entry.name, pattern) for pattern in name_patterns)
+                ]
+
+        for pattern in nested_patterns:
+            excel_files.extend(
+                path for path in self.input_dir.glob(pattern)
+                if not path.name.startswith(".") and path.is_file() and path not in excel_files
+            )
 
         logger.info(f"Found {len(excel_files)} Excel files in {self.input_dir}")
         return excel_files
 
-    def detect_column(self, df: pd.DataFrame, field_name: str) -> Optional[str]:
+    def _build_alias_index(self) -> None:
+        """
+        Build the lowercase alias lists and, if available, an Aho-Corasick
+        automaton matching every alias of every field in one pass per header.
+        """
+        mappings = self.column_mappings or {}
+
+        self._alias_lower = {
+            field_name: [name.lower() for name in names]
+            for field_name, names in mappings.items()
+        }
+        self._indexed_mappings = {field_name: list(names) for field_name, names in mappings.items()}
+        self._schema_cache.clear()
+        self._automaton = None
+
+        if AHOCORASICK_AVAILABLE and self._alias_lower:
+            automaton = ahocorasick.Automaton()
+            fields_by_alias: Dict[str, List[str]] = {}
+            for field_name, aliases in self._alias_lower.items():
+                for alias in aliases:
+                    fields_by_alias.setdefault(alias, []).append(field_name)
+
+            # An alias may belong to several fields (e.g. "Contact")
+            for alias, field_names in fields_by_alias.items():
+                automaton.add_word(alias, tuple(field_names))
+            automaton.make_automaton()
+            self._automaton = automaton
+
+    def _ensure_alias_index(self) -> None:
+        """Rebuild the alias index if column_mappings was changed after init."""
+        if self.column_mappings != self._indexed_mappings:
+            self._build_alias_index()
+
+    @staticmethod
+    def _lowercase_columns(df: pd.DataFrame) -> List[Tuple[Any, str]]:
+        """
+        Build (column, cleaned lowercase name) pairs for a DataFrame.
+
+        Args:
+            df: DataFrame whose columns to prepare
+
+        Returns:
+            List of (original column, lowercase stripped name) tuples
+        """
+        return [(col, str(col).strip().lower()) for col in df.columns]
+
+    def detect_column(
+        self,
+        df: pd.DataFrame,
+        field_name: str,
+        columns_lower: Optional[List[Tuple[Any, str]]] = None
+    ) -> Optional[str]:
         """
         Detect which column in the DataFrame corresponds to a standard field.
 
         Args:
             df: DataFrame to search
             field_name: Standard field name to look for
+            columns_lower: Optional precomputed output of _lowercase_columns(df),
+                           to avoid recomputing it for every field
 
         Returns:
             Actual column name if found, None otherwise
         """
-        possible_names = self.column_mappings.get(field_name, [])
+        self._ensure_alias_index()
+        aliases = self._alias_lower.get(field_name, [])
+
+        if columns_lower is None:
+            columns_lower = self._lowercase_columns(df)
 
-        for col in df.columns:
-            col_clean = str(col).strip()
-            for possible_name in possible_names:
-                if possible_name.lower() in col_clean.lower():
-                    logger.debug(f"Mapped '{col}' to '{field_name}'")
+        for col, col_lower in columns_lower:
+            for alias in aliases:
+                if alias in col_lower:
+                    logger.debug("Mapped '{}' to '{}'", col, field_name)
                     return col
 
         return None
 
+    def detect_columns(self, df: pd.DataFrame) -> Dict[str, Any]:
+        """
+        Detect the columns for all mapped fields at once.
+
+        Each header is scanned once against every alias; a field is mapped to
+        the first column that matches any of its aliases, as in detect_column.
+
+        Args:
+            df: DataFrame to search
+
+        Returns:
+            Dictionary mapping standard field names to actual column names
+        """
+        self._ensure_alias_index()
+        columns_lower = self._lowercase_columns(df)
+
+        if self._automaton is None:
+            column_map = {}
+            for field_name in self._alias_lower:
+                col = self.detect_column(df, field_name, columns_lower)
+                if col is not None:
+                    column_map[field_name] = col
+            return column_map
+
+        found: Dict[str, Any] = {}
+        for col, col_lower in columns_lower:
+            for _, field_names in self._automaton.iter(col_lower):
+                for field_name in field_names:
+                    if field_name not in found:
+                        found[field_name] = col
+                        logger.debug("Mapped '{}' to '{}'", col, field_name)
+
+        # Keep the column_mappings field order
+        return {field_name: found[field_name] for field_name in self._alias_lower if field_name in found}
+
     def normalize_power_value(self, value: Any) -> Optional[float]:
         """
         Normalize power values to MW.
@@ -151,11 +316,224 @@ class ExcelDataLoader:
             logger.warning(f"Could not parse power value '{value}': {e}")
             return None
 
+    @staticmethod
+    def _normalize_headers(headers: Tuple[Any, ...]) -> List[str]:
+        """
+        Normalize a raw header row the same way pandas does.
+
+        Empty cells become "Unnamed: N" and duplicate names get a ".N" suffix.
+
+        Args:
+            headers: Raw values of the header row
+
+        Returns:
+            List of unique column names
+        """
+        columns = []
+        seen: Dict[str, int] = {}
+
+        for i, header in enumerate(headers):
+            name = f"Unnamed: {i}" if header is None or str(header).strip() == "" else header
+
+            key = str(name)
+            if key in seen:
+                seen[key] += 1
+                name = f"{key}.{seen[key]}"
+            else:
+                seen[key] = 0
+
+            columns.append(name)
+
+        return columns
+
+    @staticmethod
+    def _engine(file_path: Path) -> str:
+        """
+        Get the parser iter_sheets uses for a file.
+
+        Args:
+            file_path: Path to Excel file
+
+        Returns:
+            "calamine", "openpyxl" or "pandas"
+        """
+        if CALAMINE_AVAILABLE:
+            return "calamine"
+        if file_path.suffix.lower() in (".xlsx", ".xlsm"):
+            return "openpyxl"
+        return "pandas"
+
+    @classmethod
+    def _read_sheet(cls, excel_file: pd.ExcelFile, sheet_name: str) -> pd.DataFrame:
+        """
+        Read one sheet as text.
+
+        All values are processed as strings downstream (power is parsed from
+        text), so type inference and NaN detection are skipped: every cell is
+        read as str and empty cells come back as "".
+
+        Args:
+            excel_file: Open Excel file
+            sheet_name: Name of the sheet to read
+
+        Returns:
+            DataFrame with string values
+        """
+        return pd.read_excel(excel_file, sheet_name=sheet_name, **cls.READ_OPTIONS)
+
+    def iter_sheets(self, file_path: Path) -> Iterator[Tuple[str, pd.DataFrame]]:
+        """
+        Iterate over all sheets of an Excel file, opening the workbook only once.
+
+        When python-calamine is installed, every format is parsed by the native
+        calamine engine. Otherwise XLSX files are read with openpyxl in
+        read-only mode, which streams rows instead of building the full
+        workbook object tree, and other formats (.xls) fall back to pandas.
+
+        Args:
+            file_path: Path to Excel file
+
+        Yields:
+            Tuples of (sheet_name, DataFrame)
+        """
+        engine = self._engine(file_path)
+        if engine == "calamine":
+            with pd.ExcelFile(file_path, engine="calamine") as excel_file:
+                for sheet_name in excel_file.sheet_names:
+                    yield sheet_name, self._read_sheet(excel_file, sheet_name)
+        elif engine == "openpyxl":
+            wb = load_workbook(file_path, read_only=True, data_only=True, keep_links=False)
+            try:
+                for ws in wb.worksheets:
+                    rows = ws.iter_rows(values_only=True)
+                    headers = next(rows, None)
+
+                    if headers is None:
+                        yield ws.title, pd.DataFrame()
+                        continue
+
+                    # Keep the cell values as read, without dtype inference
+                    df = pd.DataFrame(list(rows), columns=self._normalize_headers(headers), dtype=object)
+                    yield ws.title, df
+            finally:
+                wb.close()
+        else:
+            # Parse every sheet from the already-opened file instead of re-reading it
+            with pd.ExcelFile(file_path) as excel_file:
+                for sheet_name in excel_file.sheet_names:
+                    yield sheet_name, self._read_sheet(excel_file, sheet_name)
+
+    def normalize_power_series(self, values: pd.Series) -> pd.Series:
+        """
+        Normalize a whole column of power values to MW in one vectorized pass.
+
+        Applies the same rules as normalize_power_value: digits and dots
+        before the first K/M/G letter form the number, and that letter
+        selects the unit.
+
+        Args:
+            values: Series of raw power values
+
+        Returns:
+            Float Series with power in MW (NaN where the value is invalid)
+        """
+        value_str = (
+            values.astype(str)
+            .str.upper()
+            .str.replace(",", ".", regex=False)
+            .str.replace(" ", "", regex=False)
+        )
+
+        # Everything before the first unit letter, and the unit letter itself
+        parts = value_str.str.extract(r"^([^KMG]*)([KMG]?)")
+        numeric_part = parts[0].str.replace(r"[^0-9.]", "", regex=True)
+
+        power = pd.to_numeric(numeric_part, errors="coerce")
+        multiplier = parts[1].map({"K": 1 / 1000, "G": 1000.0}).fillna(1.0)
+
+        return (power * multiplier).where(values.notna())
+
+    @staticmethod
+    def _clean_column(values: pd.Series) -> np.ndarray:
+        """
+        Convert a column to stripped strings in one pass.
+
+        Equal values share a single string object, so repetitive columns
+        (source types, counties, units) cost one string per distinct value
+        rather than one per row.
+
+        Args:
+            values: Column values
+
+        Returns:
+            Object array with stripped strings, None for missing or empty cells
+        """
+        cleaned = np.full(len(values), None, dtype=object)
+        present = values.notna().to_numpy()
+
+        if present.any():
+            text = values[present].map(str).str.strip()
+            codes, uniques = pd.factorize(text.where(text != "", None))
+            # Code -1 (empty cell) picks the trailing None
+            cleaned[present] = np.append(np.asarray(uniques, dtype=object), None)[codes]
+
+        return cleaned
+
+    def _extract_structured_records(
+        self,
+        df: pd.DataFrame,
+        file_name: str,
+        sheet_name: str
+    ) -> List[Dict[str, Any]]:
+        """
+        Extract records with standard fields using the column mappings.
+
+        Args:
+            df: Sheet DataFrame
+            file_name: Name of the source file
+            sheet_name: Name of the source sheet
+
+        Returns:
+            List of extracted records
+        """
+        self._ensure_alias_index()
+        schema_key = tuple(df.columns)
+        column_map = self._schema_cache.get(schema_key)
+
+        if column_map is None:
+            column_map = self.detect_columns(df)
+            self._schema_cache[schema_key] = column_map
+
+        if not column_map:
+            logger.warning(f"No mapped columns found in sheet '{sheet_name}', skipping")
+            return []
+
+        # Assemble the mapped fields column by column; the power column is parsed as a whole
+        out = pd.DataFrame({
+            field_name: (
+                self.normalize_power_series(df[col_name])
+                if field_name == "power_installed"
+                else self._clean_column(df[col_name])
+            )
+            for field_name, col_name in column_map.items()
+        }, index=df.index)
+
+        # Only keep rows that have at least one non-empty mapped value
+        out = out.dropna(how="all")
+
+        out.insert(0, "row_number", out.index + 2)  # +2 for Excel row number (1-indexed + header)
+        out.insert(0, "source_sheet", sheet_name)
+        out.insert(0, "source_file", file_name)
+
+        # Convert to records once per sheet, with None for missing values
+        return out.astype(object).where(out.notna(), None).to_dict("records")
+
     def load_excel_file(self, file_path: Path) -> List[Dict[str, Any]]:
         """
         Load a single Excel file and extract records.
 
         UNSTRUCTURED MODE: Indexes ALL data from ALL columns without mapping.
+        STRUCTURED MODE: Extracts only the fields defined in column_mappings.
 
         Args:
             file_path: Path to Excel file
@@ -165,76 +543,238 @@ class ExcelDataLoader:
         """
         logger.info(f"Loading Excel file: {file_path}")
         records = []
+        sheet_count = 0
+        # One string shared by every record of this file
+        file_name = file_path.name
 
         try:
-            # Read all sheets
-            excel_file = pd.ExcelFile(file_path)
-
-            for sheet_name in excel_file.sheet_names:
-                logger.debug(f"Processing sheet: {sheet_name}")
-                df = pd.read_excel(file_path, sheet_name=sheet_name)
+            # Read all sheets from a single workbook handle
+            for sheet_name, df in self.iter_sheets(file_path):
+                logger.debug("Processing sheet: {}", sheet_name)
 
                 # Skip empty sheets
                 if df.empty:
                     logger.warning(f"Sheet '{sheet_name}' is empty, skipping")
                     continue
 
+                sheet_count += 1
+
+                if self.column_mappings is not None:
+                    records.extend(self._extract_structured_records(df, file_name, sheet_name))
+                    continue
+
                 # UNSTRUCTURED: Process ALL rows with ALL columns
-                for idx, row in df.iterrows():
-                    record = {
-                        "source_file": file_path.name,
-                        "source_sheet": sheet_name,
-                        "row_number": idx + 2,  # +2 for Excel row number (1-indexed + header)
-                        "raw_data": {}  # Store all column:value pairs
+                # Convert every column to cleaned strings once, then walk the arrays
+                columns = [(str(col), self._clean_column(df[col])) for col in df.columns]
+
+                for i, idx in enumerate(df.index):
+                    # Store all non-empty column:value pairs
+                    raw_data = {
+                        col_name: values[i]
+                        for col_name, values in columns
+                        if values[i] is not None
                     }
 
-                    # Extract ALL columns dynamically
-                    has_data = False
-                    for col_name in df.columns:
-                        value = row.get(col_name)
+                    # Only add records that have at least one non-empty value
+                    if raw_data:
+                        records.append({
+                            "source_file": file_name,
+                            "source_sheet": sheet_name,
+                            "row_number": int(idx) + 2,  # +2 for Excel row number (1-indexed + header)
+                            "raw_data": raw_data
+                        })
+
+        except Exception as e:
+            logger.error(f"Error loading Excel file {file_path}: {e}")
+            raise
+
+        logger.info(f"Extracted {len(records)} records from {sheet_count} sheets of {file_name}")
 
-                        if pd.isna(value):
-                            continue
+        return records
 
-                        # Convert value to string
-                        value_str = str(value).strip()
+    def __getstate__(self) -> Dict[str, Any]:
+        """Pickle only the configuration, not previously loaded records."""
+        state = self.__dict__.copy()
+        state["loaded_data"] = []
+        # Rebuilt on first use in the worker
+        state["_automaton"] = None
+        state["_indexed_mappings"] = None
+        return state
 
-                        if value_str and value_str != "":
-                            record["raw_data"][str(col_name)] = value_str
-                            has_data = True
+    def _cache_path(self, file_path: Path) -> Path:
+        """
+        Get the cache file for the current version of a source file.
 
-                    # Only add records that have at least one non-empty value
-                    if has_data:
-                        records.append(record)
+        The name is a hash of the source path followed by a hash of the
+        modification time and size of the file, the column mappings, the
+        parser engine, the read options and CACHE_VERSION, so any change to
+        these yields a new cache entry and _write_cache can find the entries
+        it replaces.
 
-                logger.info(f"Extracted {len(records)} records from sheet '{sheet_name}'")
+        Args:
+            file_path: Path to Excel file
 
+        Returns:
+            Path to the Parquet cache file
+        """
+        stat = file_path.stat()
+        mappings = sorted(self.column_mappings.items()) if self.column_mappings is not None else None
+        read_options = sorted((name, str(value)) for name, value in self.READ_OPTIONS.items())
+        source_key = hashlib.blake2b(str(file_path.resolve()).encode(), digest_size=8).hexdigest()
+        version_key = hashlib.blake2b(
+            f"{self.CACHE_VERSION}:{stat.st_mtime_ns}:{stat.st_size}:{mappings!r}:"
+            f"{self._engine(file_path)}:{read_options!r}".encode(),
+            digest_size=16
+        ).hexdigest()
+        return self._cache_dir / f"{source_key}-{version_key}.parquet"
+
+    def _read_cache(self, cache_path: Path) -> Optional[List[Dict[str, Any]]]:
+        """
+        Read cached records for a source file.
+
+        Args:
+            cache_path: Path returned by _cache_path
+
+        Returns:
+            Cached records, or None if there is no usable cache entry
+        """
+        if not cache_path.exists():
+            return None
+
+        try:
+            import pyarrow.parquet as pq
+
+            table = pq.read_table(cache_path)
         except Exception as e:
-            logger.error(f"Error loading Excel file {file_path}: {e}")
-            raise
+            logger.warning(f"Ignoring unreadable cache file {cache_path}: {e}")
+            return None
+
+        records = table.to_pylist()
+
+        # Map columns come back as lists of (key, value) pairs
+        if "raw_data" in table.column_names:
+            for record in records:
+                record["raw_data"] = dict(record["raw_data"])
+
+        # The table holds the union of all sheets' fields; restore each sheet's own keys
+        metadata = table.schema.metadata or {}
+        if b"sheet_fields" in metadata:
+            sheet_fields = json.loads(metadata[b"sheet_fields"])
+            records = [
+                {key: record[key] for key in sheet_fields[record["source_sheet"]]}
+                for record in records
+            ]
 
         return records
 
-    def load_all_files(self, file_patterns: List[str] = None) -> List[Dict[str, Any]]:
+    def _write_cache(self, cache_path: Path, records: List[Dict[str, Any]]):
+        """
+        Store the records parsed from a source file.
+
+        Args:
+            cache_path: Path returned by _cache_path
+            records: Records extracted from the file
+        """
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+
+            if records and "raw_data" in records[0]:
+                table = pa.Table.from_pylist(records, schema=pa.schema([
+                    ("source_file", pa.string()),
+                    ("source_sheet", pa.string()),
+                    ("row_number", pa.int64()),
+                    ("raw_data", pa.map_(pa.string(), pa.string())),
+                ]))
+            else:
+                # Structured sheets may map different fields
+                sheet_fields: Dict[str, List[str]] = {}
+                for record in records:
+                    sheet_fields.setdefault(record["source_sheet"], list(record))
+                table = pa.Table.from_pylist(
+                    records, metadata={"sheet_fields": json.dumps(sheet_fields)}
+                )
+
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+            pq.write_table(table, cache_path)
+        except Exception as e:
+            logger.warning(f"Could not write cache file {cache_path}: {e}")
+            return
+
+        # Drop the entries of older versions of the same source file
+        source_key = cache_path.name.split("-", 1)[0]
+        for old_path in self._cache_dir.glob(f"{source_key}-*.parquet"):
+            if old_path != cache_path:
+                old_path.unlink(missing_ok=True)
+
+    def load_all_files(
+        self,
+        file_patterns: List[str] = None,
+        max_workers: Optional[int] = None,
+        use_cache: bool = True
+    ) -> List[Dict[str, Any]]:
         """
         Load all Excel files from the input directory.
 
+        Files are independent, so they are parsed in parallel worker
+        processes when there are more than a handful of files to load. Records of
+        files unchanged since a previous run are read from the Parquet
+        cache in the cache directory next to the input directory.
+
         Args:
             file_patterns: File patterns to match
+            max_workers: Maximum number of worker processes
+                         (default: CPU count, 1 disables multiprocessing)
+            use_cache: Reuse and store parsed records in the cache
 
         Returns:
             List of all extracted records
         """
         excel_files = self.find_excel_files(file_patterns)
-        all_records = []
 
-        for file_path in excel_files:
-            try:
-                records = self.load_excel_file(file_path)
-                all_records.extend(records)
-            except Exception as e:
-                logger.error(f"Failed to process {file_path}: {e}")
-                continue
+        # Records per file, in file order; None until the file is loaded
+        file_records: List[Optional[List[Dict[str, Any]]]] = [None] * len(excel_files)
+        cache_paths: List[Optional[Path]] = [None] * len(excel_files)
+
+        if use_cache:
+            for i, file_path in enumerate(excel_files):
+                cache_paths[i] = self._cache_path(file_path)
+                file_records[i] = self._read_cache(cache_paths[i])
+
+            cached = sum(records is not None for records in file_records)
+            if cached:
+                logger.info(f"Loaded {cached} unchanged files from cache")
+
+        pending = [i for i, records in enumerate(file_records) if records is None]
+        num_workers = min(max_workers or os.cpu_count() or 1, len(pending))
+        if len(pending) <= _MIN_FILES_FOR_WORKERS:
+            num_workers = 1
+
+        if num_workers > 1:
+            logger.info(f"Loading {len(pending)} files with {num_workers} worker processes")
+            with ProcessPoolExecutor(max_workers=num_workers) as executor:
+                futures = [executor.submit(self.load_excel_file, excel_files[i]) for i in pending]
+
+                for i, future in zip(pending, futures):
+                    try:
+                        file_records[i] = future.result()
+                    except Exception as e:
+                        logger.error(f"Failed to process {excel_files[i]}: {e}")
+                        continue
+        else:
+            for i in pending:
+                try:
+                    file_records[i] = self.load_excel_file(excel_files[i])
+                except Exception as e:
+                    logger.error(f"Failed to process {excel_files[i]}: {e}")
+                    continue
+
+        if use_cache:
+            for i in pending:
+                if file_records[i] is not None:
+                    self._write_cache(cache_paths[i], file_records[i])
+
+        all_records = [record for records in file_records if records for record in records]
 
         self.loaded_data = all_records
         logger.info(f"Total records loaded: {len(all_records)}")
@@ -251,16 +791,26 @@ class ExcelDataLoader:
         Returns:
             Tuple of (valid_records, invalid_records)
         """
-        valid = []
-        invalid = []
-
-        for record in records:
-            try:
-                energy_record = EnergyRecord(**record)
-                valid.append(energy_record)
-            except Exception as e:
-                logger.warning(f"Invalid record from {record.get('source_file')}: {e}")
-                invalid.append(record)
+        # Validate the whole batch in one call; only on failure split out the bad records
+        try:
+            valid = _ENERGY_RECORDS_ADAPTER.validate_python(records)
+            invalid = []
+        except ValidationError as e:
+            errors: Dict[int, List[str]] = {}
+            for error in e.errors():
+                errors.setdefault(error["loc"][0], []).append(
+                    f"{'.'.join(str(loc) for loc in error['loc'][1:])}: {error['msg']}"
+                )
+
+            invalid = []
+            for i in sorted(errors):
+                source_file = records[i].get("source_file") if isinstance(records[i], dict) else None
+                logger.warning(f"Invalid record from {source_file}: {'; '.join(errors[i])}")
+                invalid.append(records[i])
+
+            valid = _ENERGY_RECORDS_ADAPTER.validate_python(
+                [record for i, record in enumerate(records) if i not in errors]
+            )
 
         logger.info(f"Validation: {len(valid)} valid, {len(invalid)} invalid records")
         return valid, invalid
@@ -280,20 +830,33 @@ class ExcelDataLoader:
 
         return pd.DataFrame(records)
 
-    def export_to_json(self, output_path: str, records: List[Dict[str, Any]] = None):
+    def export_to_json(
+        self,
+        output_path: str,
+        records: List[Dict[str, Any]] = None,
+        indent: bool = True
+    ):
         """
         Export records to JSON file.
 
+        Uses orjson when installed, falling back to the standard json module.
+
         Args:
             output_path: Path to output JSON file
             records: List of records (uses loaded_data if None)
+            indent: Pretty-print with 2-space indentation (disable for smaller, faster output)
         """
         if records is None:
             records = self.loaded_data
 
-        import json
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(records, f, ensure_ascii=False, indent=2)
+        if ORJSON_AVAILABLE:
+            options = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+            if indent:
+                options |= orjson.OPT_INDENT_2
+            Path(output_path).write_bytes(orjson.dumps(records, option=options))
+        else:
+            with open(output_path, 'w', encoding='utf-8') as f:
+                json.dump(records, f, ensure_ascii=False, indent=2 if indent else None)
 
         logger.info(f"Exported {len(records)} records to {output_path}")
 
@@ -308,8 +871,17 @@ class ExcelDataLoader:
         if records is None:
             records = self.loaded_data
 
-        df = self.to_dataframe(records)
-        df.to_parquet(output_path, index=False)
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ImportError("PyArrow not installed. Install with: pip install pyarrow")
+
+        # Build the columns straight from the records, without an intermediate DataFrame
+        columns = dict.fromkeys(key for record in records for key in record)
+        table = pa.table({col: [record.get(col) for record in records] for col in columns})
+
+        pq.write_table(table, output_path, compression="zstd")
 
         logger.info(f"Exported {len(records)} records to {output_path}")
 
@@ -326,16 +898,42 @@ class ExcelDataLoader:
         if records is None:
             records = self.loaded_data
 
-        df = self.to_dataframe(records)
+        # Aggregate straight from the records instead of building a DataFrame
+        columns = dict.fromkeys(key for record in records for key in record)
+
+        def counts(field: str) -> Counter:
+            return Counter(
+                value for record in records
+                if not self._is_missing(value := record.get(field))
+            )
 
         stats = {
             "total_records": len(records),
-            "total_files": df["source_file"].nunique() if "source_file" in df.columns else 0,
-            "total_sheets": df["source_sheet"].nunique() if "source_sheet" in df.columns else 0,
-            "source_types": df["source_type"].value_counts().to_dict() if "source_type" in df.columns else {},
-            "total_power_mw": df["power_installed"].sum() if "power_installed" in df.columns else 0,
-            "avg_power_mw": df["power_installed"].mean() if "power_installed" in df.columns else 0,
-            "null_counts": df.isnull().sum().to_dict(),
+            "total_files": len(counts("source_file")) if "source_file" in columns else 0,
+            "total_sheets": len(counts("source_sheet")) if "source_sheet" in columns else 0,
+            "source_types": dict(counts("source_type").most_common()) if "source_type" in columns else {},
+            "total_power_mw": 0,
+            "avg_power_mw": 0,
+            "null_counts": {
+                col: sum(1 for record in records if self._is_missing(record.get(col)))
+                for col in columns
+            },
         }
 
+        if "power_installed" in columns:
+            power = np.fromiter(
+                (np.nan if self._is_missing(value := record.get("power_installed")) else value
+                 for record in records),
+                dtype=np.float64,
+                count=len(records)
+            )
+            valid = ~np.isnan(power)
+            stats["total_power_mw"] = float(power[valid].sum())
+            stats["avg_power_mw"] = float(power[valid].mean()) if valid.any() else float("nan")
+
         return stats
+
+    @staticmethod
+    def _is_missing(value: Any) -> bool:
+        """Check for None/NaN the way pandas isnull does for record values."""
+        return value is None or (isinstance(value, float) and value != value)
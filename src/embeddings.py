@@ -1,13 +1,26 @@
 """
 Embeddings generation module for creating vector representations of documents.
 """
+import inspect
+import json
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Union
+from typing import List, Dict, Any, Optional, Tuple, Union
 import numpy as np
 import pickle
-from sentence_transformers import SentenceTransformer
 from loguru import logger
 
+try:
+    import simsimd
+    SIMSIMD_AVAILABLE = True
+except ImportError:
+    SIMSIMD_AVAILABLE = False
+
+
+def _cuda_available() -> bool:
+    """Check whether torch can see a CUDA device."""
+    import torch
+    return torch.cuda.is_available()
+
 
 class EmbeddingsGenerator:
     """
@@ -18,7 +31,15 @@ class EmbeddingsGenerator:
         self,
         model_name: str = "sentence-transformers/paraphrase-multilingual-mpnet-base-v2",
         batch_size: int = 32,
-        cache_dir: Optional[str] = None
+        cache_dir: Optional[str] = None,
+        normalize_embeddings: bool = True,
+        device: Optional[str] = None,
+        fp16: bool = False,
+        bf16: bool = False,
+        use_amp: bool = False,
+        num_threads: Optional[int] = None,
+        backend: str = "torch",
+        model_file: Optional[str] = None
     ):
         """
         Initialize the embeddings generator.
@@ -27,16 +48,116 @@ class EmbeddingsGenerator:
             model_name: Name of the sentence-transformers model
             batch_size: Batch size for encoding
             cache_dir: Directory to cache model files
+            normalize_embeddings: L2-normalize embeddings once when they are created,
+                                  so cosine similarity is a plain dot product
+            device: Device to run the model on (e.g. "cpu", "cuda"; default: auto-detect)
+            fp16: Run the model in half precision (CUDA only)
+            bf16: Run the model in bfloat16 (Ampere+ GPUs, or CPUs with bf16 support)
+            use_amp: Run encoding under torch autocast with bfloat16 (CUDA only)
+            num_threads: Number of threads torch uses for CPU inference (default: torch's choice)
+            backend: Inference backend: "torch", "onnx" or "openvino"
+                     (onnx/openvino need sentence-transformers>=3.2)
+            model_file: Exported model file for the onnx/openvino backends,
+                        e.g. "onnx/model_qint8_avx512_vnni.onnx" for int8 on AVX-512 CPUs
         """
         self.model_name = model_name
         self.batch_size = batch_size
         self.cache_dir = cache_dir
+        self.normalize_embeddings = normalize_embeddings
+
+        if num_threads:
+            import torch
+            torch.set_num_threads(num_threads)
+            logger.info(f"Using {num_threads} CPU threads for encoding")
 
         logger.info(f"Loading embedding model: {model_name}")
-        self.model = SentenceTransformer(model_name, cache_folder=cache_dir)
+        # Imported here: sentence-transformers pulls in torch and transformers
+        try:
+            from sentence_transformers import SentenceTransformer
+        except ImportError:
+            raise ImportError("sentence-transformers not installed. Install with: pip install sentence-transformers")
+
+        model_args: Dict[str, Any] = {"cache_folder": cache_dir, "device": device}
+        if backend != "torch":
+            model_kwargs: Dict[str, Any] = {}
+            if model_file:
+                model_kwargs["file_name"] = model_file
+            if backend == "onnx":
+                use_cuda = device.startswith("cuda") if device else _cuda_available()
+                model_kwargs["provider"] = "CUDAExecutionProvider" if use_cuda else "CPUExecutionProvider"
+            model_args.update(backend=backend, model_kwargs=model_kwargs)
+            logger.info(f"Using {backend} backend")
+
+        self.model = SentenceTransformer(model_name, **model_args)
+
+        # Reduced-precision output is upcast to float32 before it is normalized
+        self._low_precision = False
+        if fp16:
+            if self.model.device.type == "cuda":
+                self.model.half()
+                self._low_precision = True
+                logger.info("Model converted to half precision")
+            else:
+                logger.warning(f"fp16 requires a CUDA device, keeping float32 on {self.model.device}")
+        elif bf16:
+            import torch
+            self.model.to(torch.bfloat16)
+            self._low_precision = True
+            logger.info("Model converted to bfloat16")
+
+        self.use_amp = use_amp and self.model.device.type == "cuda"
+        if self.use_amp:
+            self._low_precision = True
+        elif use_amp:
+            logger.warning(f"AMP requires a CUDA device, not using autocast on {self.model.device}")
+
         self.dimension = self.model.get_sentence_embedding_dimension()
         logger.info(f"Model loaded. Embedding dimension: {self.dimension}")
 
+    def _encode(self, texts: Union[str, List[str]], **kwargs) -> np.ndarray:
+        """
+        Encode texts with the model, returning float32 numpy embeddings.
+
+        Under AMP or a reduced-precision model, normalization is done after
+        upcasting to float32 rather than inside encode().
+
+        Args:
+            texts: Text or list of texts to encode
+            **kwargs: Extra arguments for SentenceTransformer.encode
+
+        Returns:
+            Numpy array of float32 embeddings
+        """
+        normalize = self.normalize_embeddings and not self._low_precision
+
+        if self.use_amp:
+            import torch
+            with torch.autocast("cuda", dtype=torch.bfloat16):
+                embeddings = self.model.encode(texts, convert_to_numpy=True, normalize_embeddings=normalize, **kwargs)
+        else:
+            embeddings = self.model.encode(texts, convert_to_numpy=True, normalize_embeddings=normalize, **kwargs)
+
+        return self._to_float32(embeddings, normalized=normalize)
+
+    def _to_float32(self, embeddings: np.ndarray, normalized: bool) -> np.ndarray:
+        """
+        Upcast encoder output to float32 and normalize it if encode() did not.
+
+        Args:
+            embeddings: Embeddings returned by the model
+            normalized: Whether the model already normalized them
+
+        Returns:
+            Numpy array of float32 embeddings
+        """
+        # Half-precision models return float16; keep the stored matrix float32 for FAISS
+        embeddings = embeddings.astype(np.float32, copy=False)
+
+        if self.normalize_embeddings and not normalized:
+            embeddings /= np.linalg.norm(embeddings, axis=-1, keepdims=True)
+
+        return embeddings
+
     def create_document_text(self, record: Dict[str, Any]) -> str:
         """
         Create a rich text representation of a record for embedding.
@@ -95,10 +216,24 @@ class EmbeddingsGenerator:
 
         return ". ".join(parts) + "."
 
+    def create_document_texts(self, records: List[Dict[str, Any]]) -> List[str]:
+        """
+        Create text representations for a batch of records.
+
+        Args:
+            records: List of record dictionaries
+
+        Returns:
+            List of formatted text strings, in record order
+        """
+        create_text = self.create_document_text
+        return [create_text(record) for record in records]
+
     def create_embeddings(
         self,
         records: List[Dict[str, Any]],
-        show_progress: bool = True
+        show_progress: bool = True,
+        batch_size: Optional[int] = None
     ) -> np.ndarray:
         """
         Create embeddings for a list of records.
@@ -106,6 +241,7 @@ class EmbeddingsGenerator:
         Args:
             records: List of record dictionaries
             show_progress: Whether to show progress bar
+            batch_size: Batch size for encoding (default: the generator's batch_size)
 
         Returns:
             Numpy array of embeddings
@@ -113,102 +249,251 @@ class EmbeddingsGenerator:
         logger.info(f"Creating embeddings for {len(records)} records")
 
         # Create text representations
-        texts = [self.create_document_text(record) for record in records]
+        texts = self.create_document_texts(records)
 
-        # Generate embeddings
-        embeddings = self.model.encode(
+        # Generate embeddings. encode() already batches texts sorted by length
+        # and restores the input order, so batches carry little padding.
+        embeddings = self._encode(
             texts,
-            batch_size=self.batch_size,
-            show_progress_bar=show_progress,
-            convert_to_numpy=True
+            batch_size=batch_size or self.batch_size,
+            show_progress_bar=show_progress
         )
 
         logger.info(f"Created embeddings with shape: {embeddings.shape}")
         return embeddings
 
+    def create_embeddings_parallel(
+        self,
+        records: List[Dict[str, Any]],
+        devices: Optional[List[str]] = None,
+        batch_size: Optional[int] = None
+    ) -> np.ndarray:
+        """
+        Create embeddings for a list of records using one worker process per device.
+
+        Starting the pool moves the model to the CPU; it is moved back to its
+        device afterwards so later encoding does not silently run on the CPU.
+
+        Args:
+            records: List of record dictionaries
+            devices: Devices to encode on, e.g. ["cpu", "cpu"] or ["cuda:0", "cuda:1"]
+                     (default: all CUDA devices, or several CPU workers without CUDA)
+            batch_size: Batch size for encoding (default: the generator's batch_size)
+
+        Returns:
+            Numpy array of embeddings
+        """
+        logger.info(f"Creating embeddings for {len(records)} records with a multi-process pool")
+
+        texts = self.create_document_texts(records)
+
+        device = self.model.device
+        pool = self.model.start_multi_process_pool(devices)
+        try:
+            if "pool" in inspect.signature(self.model.encode).parameters:
+                embeddings = self._encode(texts, pool=pool, batch_size=batch_size or self.batch_size)
+            else:
+                # sentence-transformers < 5 only has the now deprecated encode_multi_process
+                normalize = self.normalize_embeddings and not self._low_precision
+                embeddings = self._to_float32(
+                    self.model.encode_multi_process(
+                        texts,
+                        pool,
+                        batch_size=batch_size or self.batch_size,
+                        normalize_embeddings=normalize
+                    ),
+                    normalized=normalize
+                )
+        finally:
+            self.model.stop_multi_process_pool(pool)
+            self.model.to(device)
+
+        logger.info(f"Created embeddings with shape: {embeddings.shape}")
+        return embeddings
+
     def create_query_embedding(self, query: str) -> np.ndarray:
         """
         Create embedding for a search query.
 
+        With normalize_embeddings the model's pooling output is normalized
+        before it leaves encode(), so the query is already unit-length and
+        ranking against normalized documents is a single dot product.
+
         Args:
             query: Search query text
 
         Returns:
             Numpy array embedding
         """
-        embedding = self.model.encode(query, convert_to_numpy=True)
-        return embedding
+        return self._encode(query)
+
+    def create_query_embeddings(self, queries: List[str]) -> np.ndarray:
+        """
+        Create embeddings for several search queries in batched forward passes.
+
+        Args:
+            queries: Search query texts
+
+        Returns:
+            Numpy array of shape (num_queries, dimension)
+        """
+        return self._encode(queries, batch_size=self.batch_size)
+
+    @staticmethod
+    def quantize_int8(embeddings: np.ndarray) -> Tuple[np.ndarray, float]:
+        """
+        Quantize embeddings to int8 with a single scale for the whole matrix.
+
+        Args:
+            embeddings: Numpy array of float embeddings
+
+        Returns:
+            Tuple of (int8 embeddings, scale); embeddings ~= int8 / scale
+        """
+        max_abs = float(np.max(np.abs(embeddings))) if embeddings.size else 0.0
+        scale = 127.0 / max_abs if max_abs > 0 else 1.0
+        quantized = np.rint(embeddings * scale).astype(np.int8)
+        return quantized, scale
 
     def save_embeddings(
         self,
         embeddings: np.ndarray,
         metadata: List[Dict[str, Any]],
-        save_path: str
+        save_path: str,
+        quantize: bool = False
     ):
         """
         Save embeddings and metadata to disk.
 
+        The embedding matrix goes to <save_path>.npy so it can be memory-mapped
+        on load; metadata and model information go to a <save_path>.json sidecar.
+
         Args:
             embeddings: Numpy array of embeddings
             metadata: List of metadata dictionaries
-            save_path: Path to save file
+            save_path: Path to save file (the suffix is replaced)
+            quantize: Store int8 embeddings (4x smaller) instead of float32
         """
         save_path = Path(save_path)
         save_path.parent.mkdir(parents=True, exist_ok=True)
 
-        data = {
-            "embeddings": embeddings,
-            "metadata": metadata,
+        info = {
             "model_name": self.model_name,
-            "dimension": self.dimension
+            "dimension": self.dimension,
+            "normalized": self.normalize_embeddings
         }
 
-        with open(save_path, 'wb') as f:
-            pickle.dump(data, f)
+        if quantize:
+            embeddings, info["scale"] = self.quantize_int8(embeddings)
+
+        np.save(save_path.with_suffix(".npy"), np.ascontiguousarray(embeddings))
 
-        logger.info(f"Saved embeddings to {save_path}")
+        with open(save_path.with_suffix(".json"), 'w', encoding='utf-8') as f:
+            json.dump({**info, "metadata": metadata}, f, ensure_ascii=False, default=str)
+
+        logger.info(f"Saved embeddings to {save_path.with_suffix('.npy')}")
 
     def load_embeddings(self, load_path: str) -> tuple[np.ndarray, List[Dict[str, Any]]]:
         """
         Load embeddings and metadata from disk.
 
+        The embedding matrix is memory-mapped read-only, so it is paged in on
+        demand and shared between processes. Pickle files written by older
+        versions are still read.
+
         Args:
-            load_path: Path to load file
+            load_path: Path used with save_embeddings
 
         Returns:
-            Tuple of (embeddings, metadata)
+            Tuple of (embeddings, metadata); quantized files return int8
+            embeddings, which compute_similarity accepts directly
         """
-        with open(load_path, 'rb') as f:
-            data = pickle.load(f)
+        load_path = Path(load_path)
+        npy_path = load_path.with_suffix(".npy")
+
+        if npy_path.exists():
+            with open(load_path.with_suffix(".json"), 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            embeddings = np.load(npy_path, mmap_mode='r')
+        else:
+            with open(load_path, 'rb') as f:
+                data = pickle.load(f)
+            embeddings = data.get("int8_embeddings", data.get("embeddings"))
 
         logger.info(f"Loaded embeddings from {load_path}")
         logger.info(f"Model: {data['model_name']}, Dimension: {data['dimension']}")
 
-        return data["embeddings"], data["metadata"]
+        if embeddings.dtype == np.int8:
+            return embeddings, data["metadata"]
+
+        # Files saved before normalization was stored hold raw embeddings
+        if self.normalize_embeddings and not data.get("normalized", False):
+            logger.info("Normalizing loaded embeddings")
+            embeddings = embeddings / np.linalg.norm(embeddings, axis=1, keepdims=True)
+
+        # Similarity runs single-precision BLAS on a C-ordered matrix; convert once
+        # here rather than letting every query copy the matrix (no-op for .npy files)
+        embeddings = np.ascontiguousarray(embeddings, dtype=np.float32)
+
+        return embeddings, data["metadata"]
 
     def compute_similarity(
         self,
         query_embedding: np.ndarray,
-        document_embeddings: np.ndarray
+        document_embeddings: np.ndarray,
+        normalized: Optional[bool] = None
     ) -> np.ndarray:
         """
-        Compute cosine similarity between query and documents.
+        Compute cosine similarity between queries and documents.
+
+        For unit-length document embeddings this is a single matrix product;
+        otherwise SimSIMD's fused norm + dot kernels are used when available.
+        int8 document embeddings (see quantize_int8) are compared against
+        int8-quantized queries.
 
         Args:
-            query_embedding: Query embedding vector
+            query_embedding: Query embedding vector, or a (num_queries, dim) matrix
             document_embeddings: Array of document embeddings
+            normalized: Whether document_embeddings are L2-normalized
+                        (default: the generator's normalize_embeddings setting)
 
         Returns:
-            Array of similarity scores
+            Array of similarity scores, shape (num_documents,) for a single query
+            or (num_queries, num_documents) for a query matrix
         """
-        # Normalize vectors
-        query_norm = query_embedding / np.linalg.norm(query_embedding)
-        doc_norms = document_embeddings / np.linalg.norm(document_embeddings, axis=1, keepdims=True)
+        if normalized is None:
+            normalized = self.normalize_embeddings
+
+        single = query_embedding.ndim == 1
+        queries = query_embedding.reshape(1, -1) if single else query_embedding
+
+        if document_embeddings.dtype == np.int8:
+            # Cosine is scale-invariant, so each query gets its own scale
+            max_abs = np.abs(queries).max(axis=1, keepdims=True)
+            queries = np.rint(queries * (127.0 / np.where(max_abs > 0, max_abs, 1.0))).astype(np.int8)
+            if not SIMSIMD_AVAILABLE:
+                queries = queries.astype(np.float32)
+                document_embeddings = document_embeddings.astype(np.float32)
+            normalized = False
+
+        if normalized:
+            queries_norm = queries / np.linalg.norm(queries, axis=1, keepdims=True)
+            similarities = queries_norm @ document_embeddings.T
+        elif SIMSIMD_AVAILABLE:
+            if queries.dtype != np.int8:
+                queries = np.ascontiguousarray(queries, dtype=np.float32)
+                document_embeddings = np.ascontiguousarray(document_embeddings, dtype=np.float32)
+            distances = np.asarray(simsimd.cdist(queries, document_embeddings, metric="cosine"))
+            similarities = (1.0 - distances).astype(np.float32, copy=False)
+        else:
+            # Normalize vectors
+            queries_norm = queries / np.linalg.norm(queries, axis=1, keepdims=True)
+            doc_norms = document_embeddings / np.linalg.norm(document_embeddings, axis=1, keepdims=True)
 
-        # Compute cosine similarity
-        similarities = np.dot(doc_norms, query_norm)
+            # Compute cosine similarity
+            similarities = queries_norm @ doc_norms.T
 
-        return similarities
+        return similarities[0] if single else similarities
 
     def get_top_k_similar(
         self,
@@ -216,7 +501,8 @@ class EmbeddingsGenerator:
         document_embeddings: np.ndarray,
         metadata: List[Dict[str, Any]],
         k: int = 5,
-        threshold: float = 0.0
+        threshold: float = 0.0,
+        normalized: Optional[bool] = None
     ) -> List[Dict[str, Any]]:
         """
         Get top-k most similar documents to a query.
@@ -227,35 +513,38 @@ class EmbeddingsGenerator:
             metadata: List of metadata for each document
             k: Number of results to return
             threshold: Minimum similarity threshold
+            normalized: Whether document_embeddings are L2-normalized
+                        (default: the generator's normalize_embeddings setting)
 
         Returns:
             List of top-k results with metadata and scores
         """
-        similarities = self.compute_similarity(query_embedding, document_embeddings)
-
-        # Filter by threshold
-        valid_indices = np.where(similarities >= threshold)[0]
-        valid_similarities = similarities[valid_indices]
-
-        # Get top-k
-        if len(valid_indices) > k:
-            top_k_indices = np.argpartition(valid_similarities, -k)[-k:]
-            top_k_indices = top_k_indices[np.argsort(-valid_similarities[top_k_indices])]
+        similarities = self.compute_similarity(query_embedding, document_embeddings, normalized)
+
+        k = min(k, len(similarities))
+        if k <= 0:
+            return []
+
+        # Select the k best without sorting all scores, then apply the threshold
+        # to the k survivors only
+        if k == 1:
+            top_k_indices = np.array([np.argmax(similarities)])
+        elif k < len(similarities):
+            top_k_indices = np.argpartition(similarities, -k)[-k:]
+            top_k_indices = top_k_indices[np.argsort(similarities[top_k_indices])[::-1]]
         else:
-            top_k_indices = np.argsort(-valid_similarities)
+            top_k_indices = np.argsort(similarities)[::-1]
+        top_k_indices = top_k_indices[similarities[top_k_indices] >= threshold]
 
         # Prepare results
-        results = []
-        for idx in top_k_indices:
-            original_idx = valid_indices[idx]
-            result = {
-                "metadata": metadata[original_idx],
-                "similarity_score": float(valid_similarities[idx]),
-                "index": int(original_idx)
+        return [
+            {
+                "metadata": metadata[idx],
+                "similarity_score": float(similarities[idx]),
+                "index": int(idx)
             }
-            results.append(result)
-
-        return results
+            for idx in top_k_indices.tolist()
+        ]
 
 
 class ChromaDBEmbeddings:
@@ -303,37 +592,51 @@ class ChromaDBEmbeddings:
         self,
         embeddings: np.ndarray,
         metadata: List[Dict[str, Any]],
-        ids: Optional[List[str]] = None
+        ids: Optional[List[str]] = None,
+        batch_size: int = 1024
     ):
         """
         Add documents to ChromaDB collection.
 
+        Documents are added in batches, passing each slice of the embedding
+        matrix as a float32 array, so no list of N x D Python floats is built.
+
         Args:
             embeddings: Document embeddings
             metadata: Document metadata
             ids: Optional document IDs
+            batch_size: Number of documents per add call
         """
         if ids is None:
             ids = [f"doc_{i}" for i in range(len(embeddings))]
 
         # Create document texts from metadata
-        documents = []
-        for meta in metadata:
-            text_parts = []
-            if meta.get("client_name"):
-                text_parts.append(meta["client_name"])
-            if meta.get("source_type"):
-                text_parts.append(meta["source_type"])
-            if meta.get("address"):
-                text_parts.append(meta["address"])
-            documents.append(" ".join(text_parts))
-
-        self.collection.add(
-            embeddings=embeddings.tolist(),
-            metadatas=metadata,
-            documents=documents,
-            ids=ids
-        )
+        text_fields = ("client_name", "source_type", "address")
+        documents = [
+            " ".join(meta[field] for field in text_fields if meta.get(field))
+            for meta in metadata
+        ]
+
+        embeddings = np.asarray(embeddings, dtype=np.float32)
+
+        for start in range(0, len(embeddings), batch_size):
+            end = start + batch_size
+            batch = embeddings[start:end]
+            try:
+                self.collection.add(
+                    embeddings=batch,
+                    metadatas=metadata[start:end],
+                    documents=documents[start:end],
+                    ids=ids[start:end]
+                )
+            except ValueError:
+                # Older Chroma releases only accept lists of lists
+                self.collection.add(
+                    embeddings=batch.tolist(),
+                    metadatas=metadata[start:end],
+                    documents=documents[start:end],
+                    ids=ids[start:end]
+                )
 
         logger.info(f"Added {len(embeddings)} documents to ChromaDB")
 
@@ -381,3 +684,107 @@ class ChromaDBEmbeddings:
         self.client.delete_collection(self.collection_name)
         self.collection = self.client.create_collection(self.collection_name)
         logger.info(f"Reset collection '{self.collection_name}'")
+
+
+class FaissEmbeddings:
+    """
+    Alternative embeddings storage using a FAISS HNSW index.
+
+    A thin wrapper giving FAISSRetriever(index_type="HNSW", metric="IP") the
+    interface of ChromaDBEmbeddings: vectors are L2-normalized and searched
+    by inner product, i.e. by cosine similarity, and the index is saved in
+    the retriever's format. Documents are identified by insertion order.
+    """
+
+    def __init__(
+        self,
+        dimension: int = 768,
+        persist_directory: str = "./embeddings/faiss_hnsw",
+        m: int = 32,
+        ef_construction: int = 200
+    ):
+        """
+        Initialize the FAISS index.
+
+        Args:
+            dimension: Embedding dimension
+            persist_directory: Directory to persist the index and metadata
+            m: Number of HNSW neighbors per node
+            ef_construction: HNSW candidate list size while building the graph
+        """
+        self.dimension = dimension
+        self.m = m
+        self.ef_construction = ef_construction
+        self.persist_directory = Path(persist_directory)
+        self.retriever = self._create_retriever()
+
+        logger.info(f"FAISS HNSW index ready, dimension={dimension}")
+
+    def _create_retriever(self):
+        """Create a retriever with an empty inner-product HNSW index."""
+        from .retriever import FAISSRetriever
+
+        return FAISSRetriever(
+            dimension=self.dimension,
+            index_type="HNSW",
+            metric="IP",
+            hnsw_m=self.m,
+            ef_construction=self.ef_construction
+        )
+
+    def add_documents(self, embeddings: np.ndarray, metadata: List[Dict[str, Any]]):
+        """
+        Add documents to the index.
+
+        Args:
+            embeddings: Document embeddings
+            metadata: Document metadata
+        """
+        self.retriever.add_embeddings(embeddings, metadata)
+
+    def query(
+        self,
+        query_embedding: np.ndarray,
+        n_results: int = 5,
+        ef_search: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Query the index.
+
+        Args:
+            query_embedding: Query embedding
+            n_results: Number of results to return
+            ef_search: Optional HNSW candidate list size for this search (higher = better recall)
+
+        Returns:
+            List of results
+        """
+        results = self.retriever.search(np.asarray(query_embedding), k=n_results, ef_search=ef_search)
+
+        return [
+            {
+                "id": f"doc_{result['index']}",
+                "metadata": result["metadata"],
+                "score": result["score"],
+                "distance": 1.0 - result["score"]
+            }
+            for result in results
+        ]
+
+    def count(self) -> int:
+        """Get number of documents in the index."""
+        return self.retriever.index.ntotal
+
+    def reset(self):
+        """Delete all documents from the index."""
+        self.retriever = self._create_retriever()
+        logger.info("Reset FAISS index")
+
+    def save(self):
+        """Save the index and metadata to the persist directory."""
+        self.retriever.save_index(str(self.persist_directory))
+
+    def load(self):
+        """Load the index and metadata from the persist directory."""
+        self.retriever.load_index(str(self.persist_directory))
+        self.dimension = self.retriever.dimension
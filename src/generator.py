@@ -1,8 +1,10 @@
 """
 Generator module for LLM-based answer generation.
 """
+import itertools
+from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Iterable, Iterator, Union
 import os
 from loguru import logger
 
@@ -107,6 +109,23 @@ class AnswerGenerator:
     Generates answers using LLM based on retrieved context.
     """
 
+    # (metadata key, line format) pairs shown for each context document, in order
+    _CONTEXT_FIELDS = (
+        ("client_name", "**Companie:** {}"),
+        ("source_type", "**Sursa energie:** {}"),
+        ("power_installed", "**Putere instalata:** {} MW"),
+        ("connection_point", "**Loc racordare:** {}"),
+        ("address", "**Adresa:** {}"),
+        ("contact_person", "**Contact:** {}"),
+        ("contact_phone", "**Telefon:** {}"),
+        ("contact_email", "**Email:** {}"),
+    )
+    _CONTEXT_SOURCE_FIELDS = (
+        ("source_file", "Fisier: {}"),
+        ("source_sheet", "Sheet: {}"),
+        ("row_number", "Rand: {}"),
+    )
+
     def __init__(
         self,
         provider: str = "openai",
@@ -180,46 +199,19 @@ class AnswerGenerator:
             return "Nu au fost găsite date relevante."
 
         context_parts = []
+        fields = self._CONTEXT_FIELDS
+        source_fields = self._CONTEXT_SOURCE_FIELDS
 
         for i, result in enumerate(results, 1):
             metadata = result["metadata"]
+            get = metadata.get
             score = result.get("score", 0)
 
             parts = [f"\n### Document {i} (Relevanta: {score:.2f})"]
-
-            if metadata.get("client_name"):
-                parts.append(f"**Companie:** {metadata['client_name']}")
-
-            if metadata.get("source_type"):
-                parts.append(f"**Sursa energie:** {metadata['source_type']}")
-
-            if metadata.get("power_installed"):
-                parts.append(f"**Putere instalata:** {metadata['power_installed']} MW")
-
-            if metadata.get("connection_point"):
-                parts.append(f"**Loc racordare:** {metadata['connection_point']}")
-
-            if metadata.get("address"):
-                parts.append(f"**Adresa:** {metadata['address']}")
-
-            if metadata.get("contact_person"):
-                parts.append(f"**Contact:** {metadata['contact_person']}")
-
-            if metadata.get("contact_phone"):
-                parts.append(f"**Telefon:** {metadata['contact_phone']}")
-
-            if metadata.get("contact_email"):
-                parts.append(f"**Email:** {metadata['contact_email']}")
+            parts.extend(fmt.format(value) for key, fmt in fields if (value := get(key)))
 
             # Source information
-            source_info = []
-            if metadata.get("source_file"):
-                source_info.append(f"Fisier: {metadata['source_file']}")
-            if metadata.get("source_sheet"):
-                source_info.append(f"Sheet: {metadata['source_sheet']}")
-            if metadata.get("row_number"):
-                source_info.append(f"Rand: {metadata['row_number']}")
-
+            source_info = [fmt.format(value) for key, fmt in source_fields if (value := get(key))]
             if source_info:
                 parts.append(f"*Sursa: {', '.join(source_info)}*")
 
@@ -375,55 +367,108 @@ class ReportGenerator:
         Returns:
             Markdown formatted report
         """
-        report_parts = [
-            f"# Raport Analiza Energie",
-            f"\n## Query: {query}",
-            f"\n**Data:** {self._get_timestamp()}",
-            f"\n**Numar rezultate:** {len(results)}",
-        ]
+        header = self._render_header(query, results, statistics)
+        return "\n".join(itertools.chain(header, self._render_results(results)))
+
+    def stream_markdown_report(
+        self,
+        query: str,
+        results: List[Dict[str, Any]],
+        statistics: Optional[Dict[str, Any]] = None
+    ) -> Iterator[str]:
+        """
+        Generate a markdown report as a stream of text chunks.
+
+        The chunks concatenate to generate_markdown_report's output, but the
+        full report is never held in memory; pass the stream to save_report.
+
+        Args:
+            query: Search query
+            results: Search results
+            statistics: Optional statistics
+
+        Yields:
+            Report text chunks
+        """
+        lines = itertools.chain(self._render_header(query, results, statistics), self._render_results(results))
+        yield next(lines)
+        for line in lines:
+            yield "\n"
+            yield line
+
+    def _render_header(
+        self,
+        query: str,
+        results: List[Dict[str, Any]],
+        statistics: Optional[Dict[str, Any]] = None
+    ) -> Iterator[str]:
+        """
+        Yield the report title, query details and statistics lines.
+
+        Args:
+            query: Search query
+            results: Search results
+            statistics: Optional statistics
+
+        Yields:
+            Markdown lines
+        """
+        yield "# Raport Analiza Energie"
+        yield f"\n## Query: {query}"
+        yield f"\n**Data:** {self._get_timestamp()}"
+        yield f"\n**Numar rezultate:** {len(results)}"
 
         # Add statistics if available
         if statistics:
-            report_parts.append("\n## Statistici")
+            yield "\n## Statistici"
             for key, value in statistics.items():
-                report_parts.append(f"- **{key}:** {value}")
+                yield f"- **{key}:** {value}"
 
-        # Add results
-        report_parts.append("\n## Rezultate\n")
+    @staticmethod
+    def _render_results(results: List[Dict[str, Any]]) -> Iterator[str]:
+        """
+        Yield the markdown lines for each search result.
+
+        Args:
+            results: Search results
+
+        Yields:
+            Markdown lines
+        """
+        yield "\n## Rezultate\n"
 
         for i, result in enumerate(results, 1):
             metadata = result["metadata"]
+            get = metadata.get
             score = result.get("score", 0)
 
-            report_parts.append(f"### {i}. {metadata.get('client_name', 'N/A')} (Score: {score:.2f})")
+            yield f"### {i}. {get('client_name', 'N/A')} (Score: {score:.2f})"
 
-            if metadata.get("source_type"):
-                report_parts.append(f"- **Tip energie:** {metadata['source_type']}")
+            if get("source_type"):
+                yield f"- **Tip energie:** {metadata['source_type']}"
 
-            if metadata.get("power_installed"):
-                report_parts.append(f"- **Putere:** {metadata['power_installed']} MW")
+            if get("power_installed"):
+                yield f"- **Putere:** {metadata['power_installed']} MW"
 
-            if metadata.get("address"):
-                report_parts.append(f"- **Locație:** {metadata['address']}")
+            if get("address"):
+                yield f"- **Locație:** {metadata['address']}"
 
-            if metadata.get("connection_point"):
-                report_parts.append(f"- **Racordare:** {metadata['connection_point']}")
+            if get("connection_point"):
+                yield f"- **Racordare:** {metadata['connection_point']}"
 
             # Contacts
             contacts = []
-            if metadata.get("contact_person"):
+            if get("contact_person"):
                 contacts.append(f"Persoană: {metadata['contact_person']}")
-            if metadata.get("contact_phone"):
+            if get("contact_phone"):
                 contacts.append(f"Tel: {metadata['contact_phone']}")
-            if metadata.get("contact_email"):
+            if get("contact_email"):
                 contacts.append(f"Email: {metadata['contact_email']}")
 
             if contacts:
-                report_parts.append(f"- **Contact:** {', '.join(contacts)}")
-
-            report_parts.append("")
+                yield f"- **Contact:** {', '.join(contacts)}"
 
-        return "\n".join(report_parts)
+            yield ""
 
     def generate_summary(
         self,
@@ -470,21 +515,24 @@ Creează un sumar executiv care include:
     @staticmethod
     def _get_timestamp() -> str:
         """Get current timestamp."""
-        from datetime import datetime
         return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
-    def save_report(self, report: str, output_path: str):
+    def save_report(self, report: Union[str, Iterable[str]], output_path: str):
         """
         Save report to file.
 
         Args:
-            report: Report content
+            report: Report content, or an iterable of text chunks
+                    (e.g. from stream_markdown_report) written as they are produced
             output_path: Output file path
         """
         output_path = Path(output_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(report)
+        with open(output_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            if isinstance(report, str):
+                f.write(report)
+            else:
+                f.writelines(report)
 
         logger.info(f"Saved report to {output_path}")
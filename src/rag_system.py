@@ -1,16 +1,23 @@
 """
 Main RAG System class that orchestrates all components.
 """
+from __future__ import annotations
+
+import itertools
 from pathlib import Path
-from typing import List, Dict, Any, Optional
-import numpy as np
+from typing import TYPE_CHECKING, List, Dict, Any, Optional, Iterator
 from loguru import logger
 
-from .data_loader import ExcelDataLoader
-from .embeddings import EmbeddingsGenerator, ChromaDBEmbeddings
-from .retriever import FAISSRetriever, HybridRetriever
-from .generator import AnswerGenerator, PromptLoader, ReportGenerator
-from .utils import Timer, setup_logging, load_config
+from .utils import Timer, ProgressTracker, setup_logging, load_config
+
+# Component modules pull in pandas, torch and FAISS; they are imported in
+# initialize_components so that importing RAGSystem stays cheap
+if TYPE_CHECKING:
+    import numpy as np
+    from .data_loader import ExcelDataLoader
+    from .embeddings import EmbeddingsGenerator, ChromaDBEmbeddings
+    from .retriever import FAISSRetriever, HybridRetriever
+    from .generator import AnswerGenerator, PromptLoader, ReportGenerator
 
 
 class RAGSystem:
@@ -18,6 +25,9 @@ class RAGSystem:
     Complete RAG system for energy sector data analysis.
     """
 
+    # Maximum number of query embeddings kept for repeated questions
+    QUERY_CACHE_SIZE = 128
+
     def __init__(
         self,
         input_dir: str = "./data/input",
@@ -61,6 +71,13 @@ class RAGSystem:
         self.embeddings: Optional[np.ndarray] = None
         self.metadata: List[Dict[str, Any]] = []
 
+        # Query embeddings by query text, oldest first
+        self._query_cache: Dict[str, np.ndarray] = {}
+
+        # Default prompts, read from prompts_dir on first use
+        self._system_prompt: Optional[str] = None
+        self._user_template: Optional[str] = None
+
         logger.info("RAG System initialized")
 
     def initialize_components(
@@ -79,6 +96,11 @@ class RAGSystem:
             llm_model: LLM model name
             api_key: Optional API key
         """
+        from .data_loader import ExcelDataLoader
+        from .embeddings import EmbeddingsGenerator, ChromaDBEmbeddings
+        from .retriever import FAISSRetriever, HybridRetriever
+        from .generator import AnswerGenerator, PromptLoader, ReportGenerator
+
         logger.info("Initializing system components...")
 
         # Get config values
@@ -96,20 +118,39 @@ class RAGSystem:
         # Embeddings generator
         model_name = embedding_model or embedding_config.get("model")
         batch_size = embedding_config.get("batch_size", 32)
+        normalize = embedding_config.get("normalize", True)
 
         self.embeddings_generator = EmbeddingsGenerator(
             model_name=model_name,
-            batch_size=batch_size
+            batch_size=batch_size,
+            normalize_embeddings=normalize,
+            device=embedding_config.get("device"),
+            fp16=embedding_config.get("fp16", False),
+            bf16=embedding_config.get("bf16", False),
+            use_amp=embedding_config.get("use_amp", False),
+            num_threads=embedding_config.get("num_threads"),
+            backend=embedding_config.get("backend", "torch"),
+            model_file=embedding_config.get("model_file")
         )
+        self._query_cache.clear()
 
         # Retriever
         if not self.use_chromadb:
             dimension = embedding_config.get("dimension", 768)
-            index_type = embedding_config.get("index_type", "Flat")
+            index_type = embedding_config.get("index_type", "auto")
 
+            # "auto" picks the index type from the corpus size in index_documents
             self.retriever = FAISSRetriever(
                 dimension=dimension,
-                index_type=index_type
+                index_type="HNSW" if index_type == "auto" else index_type,
+                hnsw_m=embedding_config.get("hnsw_m", 16),
+                ef_construction=embedding_config.get("ef_construction", 64),
+                ef_search=embedding_config.get("ef_search", 40),
+                rescore_factor=embedding_config.get("rescore_factor", 10),
+                use_gpu=embedding_config.get("use_gpu_index", True),
+                nprobe=embedding_config.get("nprobe", 16),
+                pq_m=embedding_config.get("pq_m"),
+                quantization=embedding_config.get("quantization")
             )
             self.hybrid_retriever = HybridRetriever(self.retriever)
         else:
@@ -149,7 +190,9 @@ class RAGSystem:
     def index_documents(
         self,
         file_patterns: Optional[List[str]] = None,
-        force_reindex: bool = False
+        force_reindex: bool = False,
+        num_workers: Optional[int] = None,
+        use_cache: Optional[bool] = None
     ) -> int:
         """
         Load and index all documents.
@@ -157,6 +200,10 @@ class RAGSystem:
         Args:
             file_patterns: File patterns to match
             force_reindex: Force reindexing even if index exists
+            num_workers: Worker processes for loading Excel files
+                         (default: CPU count, 1 disables multiprocessing)
+            use_cache: Reuse parsed records cached from earlier runs
+                       (default: data.use_cache from config, else True)
 
         Returns:
             Number of indexed documents
@@ -178,22 +225,42 @@ class RAGSystem:
             if file_patterns is None:
                 file_patterns = self.config.get("data", {}).get("file_patterns", ["*.xlsx", "*.xls"])
 
-            self.records = self.data_loader.load_all_files(file_patterns)
+            if use_cache is None:
+                use_cache = self.config.get("data", {}).get("use_cache", True)
+
+            self.records = self.data_loader.load_all_files(
+                file_patterns,
+                max_workers=num_workers,
+                use_cache=use_cache
+            )
 
             if not self.records:
                 logger.warning("No records loaded from Excel files")
                 return 0
 
-            # Create embeddings
-            logger.info("Creating embeddings...")
-            self.embeddings = self.embeddings_generator.create_embeddings(self.records)
             self.metadata = self.records
 
-            # Index embeddings
+            # Create embeddings and index them
+            logger.info("Creating embeddings...")
             if self.use_chromadb:
+                self.embeddings = self._create_embeddings(self.records)
+
                 logger.info("Adding to ChromaDB...")
                 self.chromadb.add_documents(self.embeddings, self.metadata)
             else:
+                if self.config.get("embeddings", {}).get("index_type", "auto") == "auto":
+                    index_type = self._select_index_type(len(self.records))
+                    if index_type != self.retriever.index_type:
+                        logger.info(f"Using {index_type} index for {len(self.records)} documents")
+                        self.retriever.index_type = index_type
+                        self.retriever.index = self.retriever._create_index()
+
+                # Written to disk chunk by chunk and memory-mapped
+                self.embeddings = self._create_embeddings(
+                    self.records,
+                    self.embeddings_dir / "faiss" / "embeddings.npy"
+                )
+
                 logger.info("Building FAISS index...")
                 self.retriever.add_embeddings(self.embeddings, self.metadata)
 
@@ -203,6 +270,72 @@ class RAGSystem:
             logger.info(f"Indexed {len(self.records)} documents successfully")
             return len(self.records)
 
+    def _create_embeddings(
+        self,
+        records: List[Dict[str, Any]],
+        output_file: Optional[Path] = None
+    ) -> np.ndarray:
+        """
+        Embed records chunk by chunk.
+
+        Only one chunk of document texts exists at a time. With output_file
+        the embeddings are written into a memory-mapped temporary file next
+        to it; save_index moves it into place once the index is saved.
+
+        Args:
+            records: Records to embed
+            output_file: Optional .npy file to write the embeddings to
+
+        Returns:
+            Embedding matrix (memory-mapped when output_file is given)
+        """
+        import numpy as np
+
+        chunk_size = self.config.get("embeddings", {}).get("chunk_size", 1000)
+        if len(records) <= chunk_size and output_file is None:
+            return self.embeddings_generator.create_embeddings(records)
+
+        shape = (len(records), self.embeddings_generator.dimension)
+        if output_file is not None:
+            output_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = output_file.with_name(output_file.name + ".tmp")
+            embeddings = np.lib.format.open_memmap(tmp_file, mode="w+", dtype=np.float32, shape=shape)
+        else:
+            embeddings = np.empty(shape, dtype=np.float32)
+
+        progress = ProgressTracker(len(records), "Creating embeddings")
+        for start in range(0, len(records), chunk_size):
+            chunk = records[start:start + chunk_size]
+            embeddings[start:start + len(chunk)] = self.embeddings_generator.create_embeddings(
+                chunk,
+                show_progress=False
+            )
+            progress.update(len(chunk))
+
+        return embeddings
+
+    def _select_index_type(self, num_docs: int) -> str:
+        """
+        Pick a FAISS index type for the corpus size.
+
+        Brute force is exact and just as fast on small corpora, HNSW scales
+        sub-linearly, and IVF with 4-bit PQ FastScan keeps large corpora
+        compact in memory.
+
+        Args:
+            num_docs: Number of documents to index
+
+        Returns:
+            Index type name for FAISSRetriever
+        """
+        embedding_config = self.config.get("embeddings", {})
+
+        if num_docs < embedding_config.get("hnsw_min_docs", 1000):
+            return "Flat"
+        if num_docs < embedding_config.get("fastscan_min_docs", 50000):
+            return "HNSW"
+        return "IVFFastScan"
+
     def search(
         self,
         query: str,
@@ -230,7 +363,7 @@ class RAGSystem:
         logger.info(f"Searching for: '{query}'")
 
         # Create query embedding
-        query_embedding = self.embeddings_generator.create_query_embedding(query)
+        query_embedding = self._embed_query(query)
 
         # Search
         if self.use_chromadb:
@@ -257,6 +390,24 @@ class RAGSystem:
         logger.info(f"Found {len(results)} results")
         return results
 
+    def _embed_query(self, query: str) -> np.ndarray:
+        """
+        Return the query embedding, reusing it for repeated queries.
+
+        Args:
+            query: Search query
+
+        Returns:
+            Query embedding (shared with the cache, do not modify in place)
+        """
+        embedding = self._query_cache.get(query)
+        if embedding is None:
+            embedding = self.embeddings_generator.create_query_embedding(query)
+            if len(self._query_cache) >= self.QUERY_CACHE_SIZE:
+                del self._query_cache[next(iter(self._query_cache))]
+            self._query_cache[query] = embedding
+        return embedding
+
     def query(
         self,
         question: str,
@@ -296,12 +447,16 @@ class RAGSystem:
 
         # Load prompts if not provided
         if system_prompt is None:
-            system_prompts = self.prompt_loader.load_system_prompts()
-            system_prompt = system_prompts.get("system_general", "")
+            if self._system_prompt is None:
+                system_prompts = self.prompt_loader.load_system_prompts()
+                self._system_prompt = system_prompts.get("system_general", "")
+            system_prompt = self._system_prompt
 
         if user_prompt_template is None:
-            user_prompts = self.prompt_loader.load_user_prompts()
-            user_prompt_template = user_prompts.get("user_query_template", "")
+            if self._user_template is None:
+                user_prompts = self.prompt_loader.load_user_prompts()
+                self._user_template = user_prompts.get("user_query_template", "")
+            user_prompt_template = self._user_template
 
         # Generate answer
         answer = self.answer_generator.generate_with_prompts(
@@ -331,14 +486,17 @@ class RAGSystem:
 
             lines.append(f"\n{i}. {metadata.get('client_name', 'N/A')} (Relevanta: {score:.2f})")
 
-            if metadata.get("source_type"):
-                lines.append(f"   Sursa energie: {metadata['source_type']}")
+            source_type = metadata.get("source_type")
+            if source_type:
+                lines.append(f"   Sursa energie: {source_type}")
 
-            if metadata.get("power_installed"):
-                lines.append(f"   Putere: {metadata['power_installed']} MW")
+            power_installed = metadata.get("power_installed")
+            if power_installed:
+                lines.append(f"   Putere: {power_installed} MW")
 
-            if metadata.get("address"):
-                lines.append(f"   Locatie: {metadata['address']}")
+            address = metadata.get("address")
+            if address:
+                lines.append(f"   Locatie: {address}")
 
         return "\n".join(lines)
 
@@ -359,6 +517,47 @@ class RAGSystem:
         Returns:
             Report text
         """
+        report = "".join(self._report_chunks(query, include_summary))
+
+        # Save if path provided
+        if output_path:
+            self.report_generator.save_report(report, output_path)
+
+        return report
+
+    def save_report(
+        self,
+        query: str,
+        output_path: str,
+        include_summary: bool = True
+    ):
+        """
+        Generate a comprehensive report and write it to a file.
+
+        Unlike generate_report, the report text is streamed to the file and
+        never held in memory as a whole.
+
+        Args:
+            query: Search query
+            output_path: Path to save report
+            include_summary: Whether to include LLM-generated summary
+        """
+        self.report_generator.save_report(self._report_chunks(query, include_summary), output_path)
+
+    def _report_chunks(self, query: str, include_summary: bool) -> Iterator[str]:
+        """
+        Search and return the report as a stream of text chunks.
+
+        The search and the summary run before this returns, so a failure
+        there never leaves a partially written report file.
+
+        Args:
+            query: Search query
+            include_summary: Whether to include LLM-generated summary
+
+        Returns:
+            Iterator over report text chunks
+        """
         # Search for results
         results = self.search(query)
 
@@ -368,31 +567,27 @@ class RAGSystem:
         else:
             stats = {}
 
-        # Generate report
-        report = self.report_generator.generate_markdown_report(
-            query,
-            results,
-            statistics=stats
-        )
-
         # Add summary if requested
+        prefix = []
         if include_summary and self.answer_generator:
             try:
                 summary = self.report_generator.generate_summary(query, results)
-                report = f"## Sumar Executiv\n\n{summary}\n\n---\n\n" + report
+                prefix.append(f"## Sumar Executiv\n\n{summary}\n\n---\n\n")
             except Exception as e:
                 logger.warning(f"Could not generate summary: {e}")
 
-        # Save if path provided
-        if output_path:
-            self.report_generator.save_report(report, output_path)
-
-        return report
+        return itertools.chain(
+            prefix,
+            self.report_generator.stream_markdown_report(query, results, statistics=stats)
+        )
 
     def save_index(self, save_path: Optional[str] = None):
         """
         Save the index to disk.
 
+        The embedding matrix is written next to the FAISS index as
+        embeddings.npy so load_index can memory-map it.
+
         Args:
             save_path: Optional custom save path
         """
@@ -404,6 +599,42 @@ class RAGSystem:
         else:
             self.retriever.save_index(str(save_path))
 
+            if self.embeddings is not None:
+                self._save_embeddings(Path(save_path) / "embeddings.npy")
+
+    def _save_embeddings(self, embeddings_file: Path):
+        """
+        Write the embedding matrix to embeddings.npy.
+
+        Called only after the index is saved, so a failed build never leaves
+        new embeddings next to an old index. The file is written under a
+        temporary name and renamed into place, which keeps other processes'
+        mappings of the old file valid.
+
+        Args:
+            embeddings_file: Target .npy file
+        """
+        import numpy as np
+
+        tmp_file = embeddings_file.with_name(embeddings_file.name + ".tmp")
+        # Resolve both sides: numpy keeps a normalized path, the caller's may contain ".."
+        mapped_file = Path(self.embeddings.filename).resolve() if isinstance(self.embeddings, np.memmap) else None
+
+        if mapped_file == embeddings_file.resolve():
+            self.embeddings.flush()
+            return
+
+        if mapped_file == tmp_file.resolve():
+            # Written by _create_embeddings
+            self.embeddings.flush()
+        else:
+            with open(tmp_file, "wb") as f:
+                np.save(f, self.embeddings)
+
+        tmp_file.replace(embeddings_file)
+        if mapped_file is not None:
+            self.embeddings = np.load(embeddings_file, mmap_mode="r+")
+
     def load_index(self, load_path: Optional[str] = None):
         """
         Load index from disk.
@@ -411,6 +642,8 @@ class RAGSystem:
         Args:
             load_path: Optional custom load path
         """
+        import numpy as np
+
         if load_path is None:
             load_path = self.embeddings_dir / "faiss"
 
@@ -420,6 +653,11 @@ class RAGSystem:
             self.retriever.load_index(str(load_path))
             self.metadata = self.retriever.metadata
 
+            # Memory-mapped: pages are read on access and shared between processes
+            embeddings_file = Path(load_path) / "embeddings.npy"
+            if embeddings_file.exists():
+                self.embeddings = np.load(embeddings_file, mmap_mode="r")
+
     def get_statistics(self) -> Dict[str, Any]:
         """
         Get system statistics.
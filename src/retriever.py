@@ -1,31 +1,154 @@
 """
 Retriever module for semantic search using FAISS.
 """
+import json
+import os
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 import numpy as np
 import pickle
 from loguru import logger
 
 
+def _records_to_table(records: List[Dict[str, Any]]):
+    """
+    Convert metadata records to a pyarrow Table.
+
+    Records may carry different fields (e.g. structured sheets with
+    different mappings), so each row stores a code into the list of field
+    sets kept in the schema metadata. raw_data is stored as a string map.
+
+    Args:
+        records: Metadata records
+
+    Returns:
+        pyarrow Table
+    """
+    import pyarrow as pa
+
+    field_sets: Dict[Tuple[str, ...], int] = {}
+    codes = [field_sets.setdefault(tuple(record), len(field_sets)) for record in records]
+
+    # Union of all fields, in first-seen order
+    columns = list(dict.fromkeys(key for fields in field_sets for key in fields))
+    arrays = {
+        key: pa.array(
+            [record.get(key) for record in records],
+            type=pa.map_(pa.string(), pa.string()) if key == "raw_data" else None
+        )
+        for key in columns
+    }
+    table = pa.Table.from_pydict(arrays)
+    table = table.append_column("__fields__", pa.array(codes, type=pa.int32()))
+    return table.replace_schema_metadata({"record_fields": json.dumps([list(fields) for fields in field_sets])})
+
+
+def _table_to_records(table) -> List[Dict[str, Any]]:
+    """
+    Convert a table written by _records_to_table back to metadata records.
+
+    Args:
+        table: pyarrow Table
+
+    Returns:
+        Metadata records with their original fields
+    """
+    field_sets = json.loads(table.schema.metadata[b"record_fields"])
+    codes = table.column("__fields__").to_pylist()
+    rows = table.drop_columns(["__fields__"]).to_pylist()
+
+    records = []
+    append = records.append
+    for row, code in zip(rows, codes):
+        record = {key: row[key] for key in field_sets[code]}
+        # Map columns come back as lists of (key, value) pairs
+        raw_data = record.get("raw_data")
+        if raw_data is not None:
+            record["raw_data"] = dict(raw_data)
+        append(record)
+    return records
+
+
+class MetadataTable:
+    """
+    Read-only, columnar (Arrow) view of the metadata records of an index.
+
+    Indexing returns plain record dicts, but rows are only converted to
+    Python objects when they are accessed, so loading a large index does
+    not build one dict per document.
+    """
+
+    def __init__(self, table):
+        """
+        Initialize the metadata table.
+
+        Args:
+            table: pyarrow Table written by _records_to_table
+        """
+        self.table = table
+
+    def __len__(self) -> int:
+        return self.table.num_rows
+
+    def __getitem__(self, idx: int) -> Dict[str, Any]:
+        return self.take([idx])[0]
+
+    def __iter__(self):
+        for batch in self.table.to_batches(max_chunksize=10000):
+            yield from _table_to_records(self.table.from_batches([batch]))
+
+    def take(self, ids) -> List[Dict[str, Any]]:
+        """
+        Materialize the records at the given row ids.
+
+        Args:
+            ids: Row ids
+
+        Returns:
+            List of record dicts, in the order of ids
+        """
+        return _table_to_records(self.table.take(np.asarray(ids, dtype=np.int64)))
+
+
 class FAISSRetriever:
     """
     FAISS-based retriever for semantic search.
     """
 
+    # Scalar quantizer types by quantization name
+    SQ_TYPES = {"SQ8": "QT_8bit", "SQfp16": "QT_fp16"}
+
     def __init__(
         self,
         dimension: int = 768,
         index_type: str = "Flat",
-        metric: str = "L2"
+        metric: str = "L2",
+        hnsw_m: int = 32,
+        ef_construction: int = 40,
+        ef_search: int = 16,
+        rescore_factor: int = 10,
+        use_gpu: bool = False,
+        nprobe: int = 10,
+        pq_m: Optional[int] = None,
+        quantization: Optional[str] = None
     ):
         """
         Initialize the FAISS retriever.
 
         Args:
             dimension: Embedding dimension
-            index_type: FAISS index type (Flat, IVF, HNSW)
+            index_type: FAISS index type (Flat, IVF, IVFFastScan, HNSW, Binary)
             metric: Distance metric (L2 or IP for inner product)
+            hnsw_m: Neighbors per node in the HNSW graph
+            ef_construction: HNSW candidate list size while building
+            ef_search: HNSW candidate list size while searching
+            rescore_factor: Binary index candidates fetched per result for exact rescoring
+            use_gpu: Keep Flat and IVF indexes on the first GPU when faiss-gpu
+                     and a CUDA device are available
+            nprobe: Clusters visited per query by the IVF indexes
+            pq_m: IVFFastScan sub-quantizers, 4 bits each (default: dimension // 2)
+            quantization: Scalar quantization of stored vectors for Flat, IVF and
+                          HNSW indexes: "SQ8" (int8) or "SQfp16" (float16)
         """
         try:
             import faiss
@@ -35,19 +158,50 @@ class FAISSRetriever:
         self.dimension = dimension
         self.index_type = index_type
         self.metric = metric
+        self.hnsw_m = hnsw_m
+        self.ef_construction = ef_construction
+        self.ef_search = ef_search
+        self.rescore_factor = rescore_factor
+        self.nprobe = nprobe
+        self.pq_m = dimension // 2 if pq_m is None else pq_m
+        if quantization not in (None, *self.SQ_TYPES):
+            raise ValueError(f"Unknown quantization: {quantization}")
+        self.quantization = quantization
+        # Checked again in _create_fastscan_index, since "auto" can switch to IVFFastScan later
+        if pq_m is not None or index_type == "IVFFastScan":
+            self._validate_pq_m()
         self.faiss = faiss
+        self.gpu_resources = None
+
+        if use_gpu:
+            num_gpus = faiss.get_num_gpus() if hasattr(faiss, "get_num_gpus") else 0
+            if num_gpus > 0 and hasattr(faiss, "StandardGpuResources"):
+                self.gpu_resources = faiss.StandardGpuResources()
+                logger.info("Using GPU for FAISS index")
+            else:
+                logger.info("faiss-gpu or a CUDA device is not available, using CPU index")
 
         # Create index
         self.index = self._create_index()
         self.metadata: List[Dict[str, Any]] = []
+        # Full-precision vectors kept by the Binary index for rescoring
+        self.vectors = np.empty((0, dimension), dtype=np.float32)
+        self.index_mapped = False
         self.is_trained = False
+        # Lazily built per-field value -> ids lookups (see value_ids)
+        self._value_ids: Dict[str, Optional[Dict[Any, np.ndarray]]] = {}
 
         logger.info(f"Initialized FAISS retriever with {index_type} index, dimension={dimension}")
 
     def _create_index(self):
         """Create FAISS index based on configuration."""
+        metric = self.faiss.METRIC_INNER_PRODUCT if self.metric == "IP" else self.faiss.METRIC_L2
+        sq_type = getattr(self.faiss.ScalarQuantizer, self.SQ_TYPES[self.quantization]) if self.quantization else None
+
         if self.index_type == "Flat":
-            if self.metric == "IP":
+            if sq_type is not None:
+                index = self.faiss.IndexScalarQuantizer(self.dimension, sq_type, metric)
+            elif self.metric == "IP":
                 index = self.faiss.IndexFlatIP(self.dimension)
             else:
                 index = self.faiss.IndexFlatL2(self.dimension)
@@ -55,16 +209,92 @@ class FAISSRetriever:
             # IVF with dynamic cluster count
             # FAISS requires at least 39*nlist training vectors
             # For small datasets, we'll use a smaller nlist value
-            quantizer = self.faiss.IndexFlatL2(self.dimension)
             # Store nlist as instance variable so it can be adjusted dynamically
             self.nlist = 100  # Default, will be adjusted in add_embeddings if needed
-            index = self.faiss.IndexIVFFlat(quantizer, self.dimension, self.nlist)
+            index = self._create_ivf_index()
+        elif self.index_type == "IVFFastScan":
+            # Placeholder; the cluster count is sized to the corpus when the index is trained
+            self.nlist = 100
+            index = self._create_fastscan_index()
         elif self.index_type == "HNSW":
-            index = self.faiss.IndexHNSWFlat(self.dimension, 32)
+            if sq_type is not None:
+                index = self.faiss.IndexHNSWSQ(self.dimension, sq_type, self.hnsw_m, metric)
+            elif self.metric == "IP":
+                index = self.faiss.IndexHNSWFlat(self.dimension, self.hnsw_m, self.faiss.METRIC_INNER_PRODUCT)
+            else:
+                index = self.faiss.IndexHNSWFlat(self.dimension, self.hnsw_m)
+            index.hnsw.efConstruction = self.ef_construction
+        elif self.index_type == "Binary":
+            # Sign bits only (1 bit/dim); candidates are rescored in full precision
+            index = self.faiss.IndexBinaryFlat(self.dimension)
         else:
             raise ValueError(f"Unknown index type: {self.index_type}")
 
-        return index
+        return self._to_gpu(index)
+
+    def _create_ivf_index(self):
+        """
+        Create an IVF index with self.nlist clusters.
+
+        Returns:
+            Untrained IndexIVFFlat, or IndexIVFScalarQuantizer with quantization
+        """
+        quantizer = self.faiss.IndexFlatL2(self.dimension)
+        if self.quantization:
+            sq_type = getattr(self.faiss.ScalarQuantizer, self.SQ_TYPES[self.quantization])
+            return self.faiss.IndexIVFScalarQuantizer(quantizer, self.dimension, self.nlist, sq_type)
+        return self.faiss.IndexIVFFlat(quantizer, self.dimension, self.nlist)
+
+    def _validate_pq_m(self):
+        """
+        Check that pq_m splits the embedding dimension into equal sub-vectors.
+
+        Raises:
+            ValueError: If pq_m is not a divisor of the dimension
+        """
+        if not isinstance(self.pq_m, int) or not 1 <= self.pq_m <= self.dimension or self.dimension % self.pq_m:
+            raise ValueError(
+                f"pq_m ({self.pq_m}) must be a divisor of the embedding dimension ({self.dimension})"
+            )
+
+    def _create_fastscan_index(self):
+        """
+        Create an IVF index with 4-bit PQ codes scored by SIMD lookup tables.
+
+        Returns:
+            Untrained IndexIVFPQFastScan with self.nlist clusters
+        """
+        self._validate_pq_m()
+        if self.metric == "IP":
+            quantizer = self.faiss.IndexFlatIP(self.dimension)
+            metric = self.faiss.METRIC_INNER_PRODUCT
+        else:
+            quantizer = self.faiss.IndexFlatL2(self.dimension)
+            metric = self.faiss.METRIC_L2
+        return self.faiss.IndexIVFPQFastScan(quantizer, self.dimension, self.nlist, self.pq_m, 4, metric)
+
+    def _gpu_supported(self) -> bool:
+        """Whether the configured index is kept on the GPU."""
+        if self.gpu_resources is None or self.index_type not in ("Flat", "IVF"):
+            return False
+        # FAISS has no GPU version of the flat scalar-quantizer index
+        return not (self.quantization and self.index_type == "Flat")
+
+    def _to_gpu(self, index):
+        """
+        Move an index to the GPU when GPU resources are set up.
+
+        HNSW, FastScan and binary indexes have no GPU implementation and stay on the CPU.
+
+        Args:
+            index: CPU FAISS index
+
+        Returns:
+            GPU index, or the given index unchanged
+        """
+        if not self._gpu_supported():
+            return index
+        return self.faiss.index_cpu_to_gpu(self.gpu_resources, 0, index)
 
     def add_embeddings(
         self,
@@ -81,6 +311,9 @@ class FAISSRetriever:
         if len(embeddings) != len(metadata):
             raise ValueError("Embeddings and metadata must have same length")
 
+        # FAISS takes float32 input whatever the stored precision
+        embeddings = np.ascontiguousarray(embeddings, dtype=np.float32)
+
         # Normalize if using IP metric
         if self.metric == "IP":
             self.faiss.normalize_L2(embeddings)
@@ -100,25 +333,71 @@ class FAISSRetriever:
                         f"Recreating index with {new_nlist} clusters."
                     )
                     # Recreate index with smaller nlist
-                    quantizer = self.faiss.IndexFlatL2(self.dimension)
                     self.nlist = new_nlist
-                    self.index = self.faiss.IndexIVFFlat(quantizer, self.dimension, self.nlist)
+                    self.index = self._to_gpu(self._create_ivf_index())
 
             logger.info(f"Training IVF index with {self.nlist} clusters on {n_samples} samples...")
             self.index.train(embeddings)
             self.is_trained = True
+        elif self.index_type == "IVFFastScan" and not self.is_trained:
+            n_samples = len(embeddings)
+
+            # About 4*sqrt(N) clusters, keeping 39 training samples per cluster
+            self.nlist = max(1, min(int(4 * np.sqrt(n_samples)), n_samples // 39))
+            self.index = self._create_fastscan_index()
+
+            logger.info(f"Training IVFFastScan index with {self.nlist} clusters on {n_samples} samples...")
+            self.index.train(embeddings)
+            self.is_trained = True
+        elif self.quantization and not self.index.is_trained:
+            # Scalar quantizers learn per-dimension value ranges
+            logger.info(f"Training {self.quantization} scalar quantizer on {len(embeddings)} samples...")
+            self.index.train(embeddings)
+            self.is_trained = True
+
+        if isinstance(self.metadata, MetadataTable):
+            self.metadata = list(self.metadata)
+
+        if self.index_mapped:
+            # FAISS aborts when growing a memory-mapped index; copy it into memory first
+            if self.index_type == "Binary":
+                self.index = self.faiss.deserialize_index_binary(self.faiss.serialize_index_binary(self.index))
+            else:
+                self.index = self.faiss.deserialize_index(self.faiss.serialize_index(self.index))
+            self.index_mapped = False
 
         # Add to index
-        self.index.add(embeddings)
+        if self.index_type == "Binary":
+            vectors = np.ascontiguousarray(embeddings, dtype=np.float32)
+            self.index.add(np.packbits(vectors > 0, axis=1))
+            self.vectors = np.vstack([self.vectors, vectors])
+        else:
+            self.index.add(embeddings)
+            self._cache_l2norms()
         self.metadata.extend(metadata)
+        self._value_ids.clear()
 
         logger.info(f"Added {len(embeddings)} embeddings to index. Total: {self.index.ntotal}")
 
+    def _cache_l2norms(self):
+        """
+        Cache the squared norms of the indexed vectors for exact L2 search.
+
+        Batched Flat L2 search computes ||q||^2 + ||x||^2 - 2 q.x with the dot
+        products from BLAS; with the cache the ||x||^2 term is not recomputed
+        over the whole index on every search. FAISS does not update the cache
+        on add, so it is rebuilt after every change.
+        """
+        if isinstance(self.index, self.faiss.IndexFlatL2):
+            self.index.sync_l2norms()
+
     def search(
         self,
         query_embedding: np.ndarray,
         k: int = 5,
-        threshold: Optional[float] = None
+        threshold: Optional[float] = None,
+        ids: Optional[np.ndarray] = None,
+        ef_search: Optional[int] = None
     ) -> List[Dict[str, Any]]:
         """
         Search for similar documents.
@@ -127,54 +406,145 @@ class FAISSRetriever:
             query_embedding: Query embedding vector
             k: Number of results to return
             threshold: Optional distance threshold
+            ids: Optional ids to restrict the search to (not supported on GPU indexes)
+            ef_search: Optional HNSW candidate list size for this search
 
         Returns:
             List of results with metadata and scores
         """
-        if self.index.ntotal == 0:
-            logger.warning("Index is empty")
-            return []
+        return self.search_batch(
+            query_embedding.reshape(1, -1), k=k, threshold=threshold, ids=ids, ef_search=ef_search
+        )[0]
+
+    def search_batch(
+        self,
+        query_embeddings: np.ndarray,
+        k: int = 5,
+        threshold: Optional[float] = None,
+        ids: Optional[np.ndarray] = None,
+        ef_search: Optional[int] = None
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Search for several queries with a single index call.
+
+        Args:
+            query_embeddings: Query embeddings matrix of shape (n_queries, dimension)
+            k: Number of results to return per query
+            threshold: Optional distance threshold
+            ids: Optional ids to restrict the search to (not supported on GPU indexes)
+            ef_search: Optional HNSW candidate list size for this search, trading
+                       latency for recall without rebuilding (default: the constructor value)
+
+        Returns:
+            One list of results with metadata and scores per query
+        """
+        if self.index.ntotal == 0 or (ids is not None and len(ids) == 0):
+            if self.index.ntotal == 0:
+                logger.warning("Index is empty")
+            return [[] for _ in range(len(query_embeddings))]
 
-        # Reshape query
-        query = query_embedding.reshape(1, -1).astype('float32')
+        # Copy, since normalization works in place
+        queries = np.array(query_embeddings, dtype=np.float32, order="C", ndmin=2)
 
         # Normalize if using IP metric
         if self.metric == "IP":
-            self.faiss.normalize_L2(query)
+            self.faiss.normalize_L2(queries)
 
-        # Search
-        if self.index_type == "IVF":
-            # Set number of probes for IVF
-            self.index.nprobe = min(10, self.index.nlist)
+        # Settings go in per-call search parameters, so the shared index is never
+        # modified and concurrent searches cannot change each other's settings
+        search_args = {}
+        if ids is not None:
+            # Only score the given ids
+            search_args["sel"] = self.faiss.IDSelectorBatch(np.asarray(ids, dtype=np.int64))
 
-        distances, indices = self.index.search(query, k)
+        if self.index_type in ("IVF", "IVFFastScan"):
+            params = self.faiss.SearchParametersIVF(nprobe=min(self.nprobe, self.index.nlist), **search_args)
+        elif self.index_type == "HNSW":
+            # efSearch below k would cap the number of results
+            params = self.faiss.SearchParametersHNSW(efSearch=max(ef_search or self.ef_search, k), **search_args)
+        elif search_args:
+            params = self.faiss.SearchParameters(**search_args)
+        else:
+            params = None
+
+        if self.index_type == "Binary":
+            distances, indices = self._search_binary(queries, k, params)
+        else:
+            distances, indices = self.index.search(queries, k, params=params)
+
+        # Convert distances to similarity scores
+        if self.metric == "IP":
+            scores = distances  # Inner product is already a similarity
+        else:
+            scores = 1.0 / (1.0 + distances)  # Convert L2 distance to similarity
+
+        keep = indices != -1  # -1 marks missing results
+        if threshold is not None:
+            keep &= scores >= threshold
+
+        # Fetch the metadata of all hits at once; a MetadataTable converts
+        # only these rows to dicts
+        hit_ids = indices[keep].tolist()
+        if isinstance(self.metadata, MetadataTable):
+            records = iter(self.metadata.take(hit_ids))
+        else:
+            records = (self.metadata[idx] for idx in hit_ids)
 
         # Format results
-        results = []
-        for i, (dist, idx) in enumerate(zip(distances[0], indices[0])):
-            if idx == -1:  # No more results
-                break
-
-            # Convert distance to similarity score
-            if self.metric == "IP":
-                score = float(dist)  # Inner product is already a similarity
-            else:
-                score = 1.0 / (1.0 + float(dist))  # Convert L2 distance to similarity
+        batch_results = []
+        for row_scores, row_distances, row_indices, row_keep in zip(
+            scores.tolist(), distances.tolist(), indices.tolist(), keep.tolist()
+        ):
+            results = [
+                {
+                    "metadata": next(records),
+                    "score": score,
+                    "distance": dist,
+                    "index": idx
+                }
+                for score, dist, idx, kept in zip(row_scores, row_distances, row_indices, row_keep)
+                if kept
+            ]
+            batch_results.append(results)
+
+        logger.debug(f"Found {sum(map(len, batch_results))} results for {len(batch_results)} queries")
+        return batch_results
+
+    def _search_binary(self, queries: np.ndarray, k: int, params=None):
+        """
+        Hamming search over sign bits, then rescore the candidates exactly.
 
-            # Apply threshold
-            if threshold is not None and score < threshold:
-                continue
+        Args:
+            queries: Query matrix of shape (n_queries, dimension)
+            k: Number of results to return
+            params: Optional FAISS search parameters (id selector)
 
-            result = {
-                "metadata": self.metadata[idx],
-                "score": score,
-                "distance": float(dist),
-                "index": int(idx)
-            }
-            results.append(result)
+        Returns:
+            Tuple of (distances, indices) shaped like faiss search output
+        """
+        n_candidates = min(self.index.ntotal, k * self.rescore_factor)
+        _, candidates = self.index.search(np.packbits(queries > 0, axis=1), n_candidates, params=params)
+
+        distances = np.full((len(queries), k), np.inf if self.metric == "L2" else -np.inf, dtype=np.float32)
+        indices = np.full((len(queries), k), -1, dtype=np.int64)
+
+        all_vectors = self.vectors
+        is_ip = self.metric == "IP"
+        for row, (query, row_candidates) in enumerate(zip(queries, candidates)):
+            row_candidates = row_candidates[row_candidates >= 0]
+            vectors = all_vectors[row_candidates]
+            if is_ip:
+                row_distances = vectors @ query
+                order = np.argsort(-row_distances)[:k]
+            else:
+                diff = vectors - query
+                row_distances = np.einsum("ij,ij->i", diff, diff)
+                order = np.argsort(row_distances)[:k]
 
-        logger.debug(f"Found {len(results)} results for query")
-        return results
+            distances[row, :len(order)] = row_distances[order]
+            indices[row, :len(order)] = row_candidates[order]
+
+        return distances, indices
 
     def save_index(self, save_path: str):
         """
@@ -186,36 +556,61 @@ class FAISSRetriever:
         save_path = Path(save_path)
         save_path.mkdir(parents=True, exist_ok=True)
 
-        # Save FAISS index
+        # Save FAISS index. Files are written next to the target and renamed
+        # over it, so processes that memory-mapped the old files keep a valid mapping
         index_file = save_path / "faiss.index"
-        self.faiss.write_index(self.index, str(index_file))
+        tmp_file = save_path / "faiss.index.tmp"
+        if self.index_type == "Binary":
+            self.faiss.write_index_binary(self.index, str(tmp_file))
+            with open(save_path / "vectors.npy.tmp", "wb") as f:
+                np.save(f, self.vectors)
+            os.replace(save_path / "vectors.npy.tmp", save_path / "vectors.npy")
+        elif self._gpu_supported():
+            self.faiss.write_index(self.faiss.index_gpu_to_cpu(self.index), str(tmp_file))
+        else:
+            self.faiss.write_index(self.index, str(tmp_file))
+        os.replace(tmp_file, index_file)
+
+        # Save metadata records as Parquet, keeping pickle for records Arrow cannot type
+        if isinstance(self.metadata, MetadataTable):
+            table = self.metadata.table
+        else:
+            try:
+                table = _records_to_table(self.metadata)
+            except Exception as e:
+                logger.warning(f"Could not store metadata as Parquet, using pickle: {e}")
+                table = None
 
-        # Save metadata
+        if table is not None:
+            import pyarrow.parquet as pq
+            pq.write_table(table, save_path / "metadata.parquet")
+
+        # Save index settings (and the metadata records when not in Parquet)
         metadata_file = save_path / "metadata.pkl"
         with open(metadata_file, 'wb') as f:
             pickle.dump({
-                "metadata": self.metadata,
+                "metadata": self.metadata if table is None else None,
                 "dimension": self.dimension,
                 "index_type": self.index_type,
                 "metric": self.metric,
-                "is_trained": self.is_trained
+                "is_trained": self.is_trained,
+                "quantization": self.quantization
             }, f)
 
         logger.info(f"Saved index to {save_path}")
 
-    def load_index(self, load_path: str):
+    def load_index(self, load_path: str, mmap: bool = True):
         """
         Load FAISS index and metadata from disk.
 
         Args:
             load_path: Path to load directory
+            mmap: Memory-map the index file instead of reading it into RAM, so
+                  only the pages touched by searches become resident. A mapped
+                  index is copied into memory before new embeddings are added.
         """
         load_path = Path(load_path)
 
-        # Load FAISS index
-        index_file = load_path / "faiss.index"
-        self.index = self.faiss.read_index(str(index_file))
-
         # Load metadata
         metadata_file = load_path / "metadata.pkl"
         with open(metadata_file, 'rb') as f:
@@ -225,10 +620,74 @@ class FAISSRetriever:
             self.index_type = data["index_type"]
             self.metric = data["metric"]
             self.is_trained = data.get("is_trained", True)
+            self.quantization = data.get("quantization")
+
+        if self.metadata is None:
+            import pyarrow.parquet as pq
+            self.metadata = MetadataTable(pq.read_table(load_path / "metadata.parquet"))
+        self._value_ids.clear()
+
+        # Load FAISS index
+        index_file = load_path / "faiss.index"
+        # GPU indexes are copied to the device, so mapping the file gains nothing
+        mmap_flag = getattr(self.faiss, "IO_FLAG_MMAP_IFC", None)
+        self.index_mapped = mmap and mmap_flag is not None and not self._gpu_supported()
+        read_index = self.faiss.read_index_binary if self.index_type == "Binary" else self.faiss.read_index
+        if self.index_mapped:
+            try:
+                index = read_index(str(index_file), mmap_flag | self.faiss.IO_FLAG_READ_ONLY)
+            except RuntimeError as e:
+                logger.warning(f"Could not memory-map index, reading it into memory: {e}")
+                self.index_mapped = False
+        if not self.index_mapped:
+            index = read_index(str(index_file))
+
+        if self.index_type == "Binary":
+            self.index = index
+            # Only the candidate rows are read when rescoring
+            self.vectors = np.load(load_path / "vectors.npy", mmap_mode="r")
+        else:
+            self.index = self._to_gpu(index)
+            self._cache_l2norms()
 
         logger.info(f"Loaded index from {load_path}")
         logger.info(f"Index contains {self.index.ntotal} embeddings")
 
+    def value_ids(self, field: str) -> Optional[Dict[Any, np.ndarray]]:
+        """
+        Get the ids of the indexed records grouped by the value of a field.
+
+        The lookup is built on first use and rebuilt after embeddings are
+        added. Records without the field are grouped under None.
+
+        Args:
+            field: Metadata field name
+
+        Returns:
+            Mapping of field value to sorted ids, or None if the field holds
+            unhashable values
+        """
+        if field not in self._value_ids:
+            if isinstance(self.metadata, MetadataTable):
+                table = self.metadata.table
+                values = table.column(field).to_pylist() if field in table.column_names else []
+            else:
+                values = [record.get(field) for record in self.metadata]
+
+            groups = {}
+            setdefault = groups.setdefault
+            try:
+                for idx, value in enumerate(values):
+                    setdefault(value, []).append(idx)
+            except TypeError:
+                self._value_ids[field] = None
+            else:
+                self._value_ids[field] = {
+                    value: np.array(group, dtype=np.int64) for value, group in groups.items()
+                }
+
+        return self._value_ids[field]
+
     def get_statistics(self) -> Dict[str, Any]:
         """
         Get statistics about the index.
@@ -251,6 +710,9 @@ class HybridRetriever:
     Hybrid retriever combining semantic search with metadata filtering.
     """
 
+    # Below this many results, building a DataFrame costs more than the Python loop
+    VECTORIZED_FILTER_MIN_RESULTS = 32
+
     def __init__(self, faiss_retriever: FAISSRetriever):
         """
         Initialize hybrid retriever.
@@ -268,6 +730,8 @@ class HybridRetriever:
         """
         Filter results by metadata criteria.
 
+        Missing and null (None/NaN) values never match a filter.
+
         Args:
             results: List of search results
             filters: Dictionary of filter criteria
@@ -275,43 +739,97 @@ class HybridRetriever:
         Returns:
             Filtered results
         """
-        filtered_results = []
-
-        for result in results:
-            metadata = result["metadata"]
-            matches = True
-
-            for key, value in filters.items():
-                if key not in metadata:
-                    matches = False
-                    break
-
-                # Handle different filter types
-                if isinstance(value, dict):
-                    # Range filter (e.g., {"min": 10, "max": 100})
-                    if "min" in value and metadata[key] < value["min"]:
-                        matches = False
-                        break
-                    if "max" in value and metadata[key] > value["max"]:
-                        matches = False
-                        break
-                elif isinstance(value, list):
-                    # List filter (value must be in list)
-                    if metadata[key] not in value:
-                        matches = False
-                        break
-                else:
-                    # Exact match
-                    if metadata[key] != value:
+        if len(results) >= self.VECTORIZED_FILTER_MIN_RESULTS:
+            mask = self._metadata_mask(results, filters)
+            filtered_results = [results[i] for i in np.flatnonzero(mask)]
+        else:
+            filtered_results = []
+            append = filtered_results.append
+            filter_items = list(filters.items())
+
+            for result in results:
+                metadata = result["metadata"]
+                matches = True
+
+                for key, value in filter_items:
+                    field_value = metadata.get(key)
+                    # Null check matching notna() in _metadata_mask (NaN != NaN)
+                    if field_value is None or field_value != field_value:
                         matches = False
                         break
 
-            if matches:
-                filtered_results.append(result)
+                    # Handle different filter types
+                    if isinstance(value, dict):
+                        # Range filter (e.g., {"min": 10, "max": 100})
+                        if "min" in value and metadata[key] < value["min"]:
+                            matches = False
+                            break
+                        if "max" in value and metadata[key] > value["max"]:
+                            matches = False
+                            break
+                    elif isinstance(value, list):
+                        # List filter (value must be in list)
+                        if metadata[key] not in value:
+                            matches = False
+                            break
+                    else:
+                        # Exact match
+                        if metadata[key] != value:
+                            matches = False
+                            break
+
+                if matches:
+                    append(result)
 
         logger.debug(f"Filtered {len(results)} results to {len(filtered_results)}")
         return filtered_results
 
+    def _metadata_mask(
+        self,
+        results: List[Dict[str, Any]],
+        filters: Dict[str, Any]
+    ) -> np.ndarray:
+        """
+        Evaluate metadata filters for all results with column operations.
+
+        Missing and null values never match.
+
+        Args:
+            results: List of search results
+            filters: Dictionary of filter criteria
+
+        Returns:
+            Boolean mask over results
+        """
+        import pandas as pd
+
+        metadata = [result["metadata"] for result in results]
+        df = pd.DataFrame({key: [meta.get(key) for meta in metadata] for key in filters})
+
+        mask = np.ones(len(results), dtype=bool)
+        for key, value in filters.items():
+            mask &= df[key].notna().to_numpy()
+            # Compare only rows still matching, so no comparison sees a null
+            column = df[key][mask]
+
+            if isinstance(value, dict):
+                # Range filter (e.g., {"min": 10, "max": 100})
+                matches = np.ones(len(column), dtype=bool)
+                if "min" in value:
+                    matches &= (column >= value["min"]).to_numpy()
+                if "max" in value:
+                    matches &= (column <= value["max"]).to_numpy()
+            elif isinstance(value, list):
+                # List filter (value must be in list)
+                matches = column.isin(value).to_numpy()
+            else:
+                # Exact match
+                matches = (column == value).to_numpy()
+
+            mask[column.index[~matches]] = False
+
+        return mask
+
     def search_with_filters(
         self,
         query_embedding: np.ndarray,
@@ -331,21 +849,61 @@ class HybridRetriever:
         Returns:
             Filtered results
         """
-        # Get more results initially to account for filtering
-        initial_k = k * 3 if filters else k
+        if not filters:
+            return self.faiss_retriever.search(query_embedding, k=k, threshold=threshold)
+
+        # Exact and list filters restrict the search to matching ids up front;
+        # all filters are still checked on the results
+        ids = self.prefilter_ids(filters)
+        ntotal = self.faiss_retriever.index.ntotal if ids is None else len(ids)
+        results = self.faiss_retriever.search(query_embedding, k=k, threshold=threshold, ids=ids)
+
+        # Double the number of candidates until k of them pass the filters.
+        # Fewer results than requested means the index (or the part of it
+        # above the threshold) is exhausted, so a larger search cannot help.
+        fetched = k
+        filtered = self.filter_by_metadata(results, filters)
+        while len(filtered) < k and len(results) == fetched and fetched < ntotal:
+            fetched = min(fetched * 2, ntotal)
+            results = self.faiss_retriever.search(query_embedding, k=fetched, threshold=threshold, ids=ids)
+            filtered = self.filter_by_metadata(results, filters)
 
-        results = self.faiss_retriever.search(
-            query_embedding,
-            k=initial_k,
-            threshold=threshold
-        )
+        # Limit to requested k
+        return filtered[:k]
 
-        # Apply metadata filters
-        if filters:
-            results = self.filter_by_metadata(results, filters)
+    def prefilter_ids(self, filters: Dict[str, Any]) -> Optional[np.ndarray]:
+        """
+        Get the ids that can match the exact and list filters.
 
-        # Limit to requested k
-        return results[:k]
+        Args:
+            filters: Dictionary of filter criteria
+
+        Returns:
+            Sorted candidate ids, or None if no filter can be looked up
+        """
+        # ID selectors are not available on GPU indexes, and HNSW graph search
+        # loses most of its recall when the selector excludes most nodes
+        if self.faiss_retriever._gpu_supported() or self.faiss_retriever.index_type == "HNSW":
+            return None
+
+        ids = None
+        for key, value in filters.items():
+            if isinstance(value, dict):
+                continue  # Range filters are only checked on the results
+
+            value_ids = self.faiss_retriever.value_ids(key)
+            if value_ids is None:
+                continue
+
+            try:
+                groups = [value_ids[v] for v in (value if isinstance(value, list) else [value]) if v in value_ids]
+            except TypeError:
+                continue  # Unhashable filter value
+
+            key_ids = np.unique(np.concatenate(groups)) if groups else np.empty(0, dtype=np.int64)
+            ids = key_ids if ids is None else np.intersect1d(ids, key_ids, assume_unique=True)
+
+        return ids
 
     def rerank_results(
         self,
@@ -365,18 +923,20 @@ class HybridRetriever:
         if not boost_fields:
             return results
 
-        for result in results:
-            metadata = result["metadata"]
-            boost = 1.0
+        metadata = [result["metadata"] for result in results]
+        boosts = np.ones(len(results))
+        for field, factor in boost_fields.items():
+            has_field = np.fromiter((bool(meta.get(field)) for meta in metadata), dtype=bool, count=len(results))
+            boosts[has_field] *= factor
 
-            for field, factor in boost_fields.items():
-                if field in metadata and metadata[field]:
-                    boost *= factor
+        scores = np.fromiter((result["score"] for result in results), dtype=np.float64, count=len(results))
+        boosted_scores = scores * boosts
+        for result, boosted_score in zip(results, boosted_scores.tolist()):
+            result["boosted_score"] = boosted_score
 
-            result["boosted_score"] = result["score"] * boost
-
-        # Sort by boosted score
-        results.sort(key=lambda x: x.get("boosted_score", x["score"]), reverse=True)
+        # Sort by boosted score (stable, like list.sort)
+        order = np.argsort(-boosted_scores, kind="stable")
+        results[:] = [results[i] for i in order]
 
         logger.debug(f"Reranked {len(results)} results")
         return results
@@ -396,29 +956,33 @@ class HybridRetriever:
         Returns:
             Aggregated statistics
         """
-        from collections import defaultdict
-
-        groups = defaultdict(lambda: {
-            "count": 0,
-            "total_power": 0,
-            "avg_score": 0,
-            "records": []
-        })
-
-        for result in results:
-            metadata = result["metadata"]
-            group_key = metadata.get(group_by, "Unknown")
-
-            groups[group_key]["count"] += 1
-            groups[group_key]["avg_score"] += result["score"]
-            groups[group_key]["records"].append(result)
+        # Group codes in order of first appearance; a dict keeps None and
+        # "Unknown" keys apart, which pandas factorize/groupby would merge into NaN
+        group_codes = {}
+        codes = np.fromiter(
+            (group_codes.setdefault(result["metadata"].get(group_by, "Unknown"), len(group_codes))
+             for result in results),
+            dtype=np.intp,
+            count=len(results)
+        )
+        scores = np.fromiter((result["score"] for result in results), dtype=np.float64, count=len(results))
+        power = [result["metadata"].get("power_installed") or 0 for result in results]
 
-            if "power_installed" in metadata and metadata["power_installed"]:
-                groups[group_key]["total_power"] += metadata["power_installed"]
+        n_groups = len(group_codes)
+        counts = np.bincount(codes, minlength=n_groups)
+        avg_scores = np.bincount(codes, weights=scores, minlength=n_groups) / np.maximum(counts, 1)
+        total_power = np.bincount(codes, weights=power, minlength=n_groups)
 
-        # Calculate averages
-        for group_key in groups:
-            count = groups[group_key]["count"]
-            groups[group_key]["avg_score"] /= count
+        # Records of each group, keeping the result order
+        order = np.argsort(codes, kind="stable")
+        group_records = np.split(order, np.cumsum(counts)[:-1]) if n_groups else []
 
-        return dict(groups)
+        return {
+            group_key: {
+                "count": int(counts[code]),
+                "total_power": float(total_power[code]),
+                "avg_score": float(avg_scores[code]),
+                "records": [results[i] for i in group_records[code]]
+            }
+            for group_key, code in group_codes.items()
+        }
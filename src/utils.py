@@ -1,12 +1,20 @@
 """
 Utility functions and helpers for the RAG system.
 """
+import re
+import time
 import yaml
 from pathlib import Path
 from typing import Dict, Any, Optional
 from loguru import logger
 import sys
 
+# Number followed by a unit, e.g. "100 MW"
+_POWER_PATTERN = re.compile(r'([\d.]+)\s*([A-Za-z]+)')
+
+# Characters not allowed in filenames, replaced by "_"
+_FILENAME_TRANSLATION = str.maketrans(dict.fromkeys('<>:"/\\|?*', '_'))
+
 
 def setup_logging(
     log_level: str = "INFO",
@@ -227,17 +235,19 @@ class ProgressTracker:
     Simple progress tracker for batch operations.
     """
 
-    def __init__(self, total: int, description: str = "Processing"):
+    def __init__(self, total: int, description: str = "Processing", log_every: int = 1000):
         """
         Initialize progress tracker.
 
         Args:
             total: Total number of items
             description: Description of operation
+            log_every: Log progress each time this many more items are processed
         """
         self.total = total
         self.current = 0
         self.description = description
+        self.log_every = max(1, log_every)
 
     def update(self, n: int = 1):
         """
@@ -246,9 +256,14 @@ class ProgressTracker:
         Args:
             n: Number of items processed
         """
+        previous = self.current
         self.current += n
-        percentage = (self.current / self.total) * 100
 
+        # Log only when crossing a multiple of log_every, and at the end
+        if self.current // self.log_every == previous // self.log_every and self.current < self.total:
+            return
+
+        percentage = (self.current / self.total) * 100
         logger.info(f"{self.description}: {self.current}/{self.total} ({percentage:.1f}%)")
 
     def finish(self):
@@ -266,15 +281,8 @@ def sanitize_filename(filename: str) -> str:
     Returns:
         Sanitized filename
     """
-    import re
-
-    # Remove invalid characters
-    sanitized = re.sub(r'[<>:"/\\|?*]', '_', filename)
-
-    # Remove leading/trailing whitespace and dots
-    sanitized = sanitized.strip('. ')
-
-    return sanitized
+    # Replace invalid characters, then remove leading/trailing whitespace and dots
+    return filename.translate(_FILENAME_TRANSLATION).strip('. ')
 
 
 def truncate_text(text: str, max_length: int = 100, suffix: str = "...") -> str:
@@ -305,10 +313,8 @@ def parse_power_unit(power_str: str) -> tuple[float, str]:
     Returns:
         Tuple of (value, unit)
     """
-    import re
-
     # Extract number and unit
-    match = re.match(r'([\d.]+)\s*([A-Za-z]+)', str(power_str).strip())
+    match = _POWER_PATTERN.match(str(power_str).strip())
 
     if match:
         value = float(match.group(1))
@@ -355,14 +361,12 @@ class Timer:
 
     def __enter__(self):
         """Start timer."""
-        import time
         self.start_time = time.time()
         logger.info(f"{self.description} started...")
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Stop timer and log duration."""
-        import time
         self.end_time = time.time()
         duration = self.end_time - self.start_time
         logger.info(f"{self.description} completed in {format_duration(duration)}")
@@ -373,7 +377,6 @@ class Timer:
         if self.start_time is None:
             return 0.0
 
-        import time
         end = self.end_time if self.end_time else time.time()
         return end - self.start_time
 
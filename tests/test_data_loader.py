@@ -45,6 +45,124 @@ class TestExcelDataLoader:
         assert loader.normalize_power_value(None) is None
         assert loader.normalize_power_value("") is None
 
+    def test_normalize_power_series(self):
+        """Test vectorized power normalization matches the scalar version."""
+        loader = ExcelDataLoader("./data/input")
+        values = pd.Series(["100 MW", "50MW", "1000 kW", "500kW", "1 GW", "1,5 MW", None, "", 75])
+
+        result = loader.normalize_power_series(values)
+
+        for raw, normalized in zip(values, result):
+            expected = loader.normalize_power_value(raw)
+            if expected is None:
+                assert pd.isna(normalized)
+            else:
+                assert normalized == pytest.approx(expected)
+
+    def test_load_excel_file_structured(self, tmp_path):
+        """Test structured extraction using column mappings."""
+        file_path = tmp_path / "furnizori.xlsx"
+        pd.DataFrame({
+            "Denumire": ["Eolica Energy SRL", "Solar Power Romania"],
+            "Tip Sursa": ["Eoliana", "Fotovoltaica"],
+            "Putere Instalata": ["150 MW", "800 kW"],
+        }).to_excel(file_path, index=False)
+
+        loader = ExcelDataLoader(
+            str(tmp_path),
+            column_mappings=ExcelDataLoader._default_column_mappings()
+        )
+        records = loader.load_excel_file(file_path)
+
+        assert len(records) == 2
+        assert records[0]["client_name"] == "Eolica Energy SRL"
+        assert records[0]["source_type"] == "Eoliana"
+        assert records[0]["power_installed"] == 150.0
+        assert records[1]["power_installed"] == 0.8
+        assert records[1]["row_number"] == 3
+        assert "raw_data" not in records[0]
+
+    def test_load_all_files_cache(self, tmp_path):
+        """Test that unchanged files are loaded from the cache."""
+        input_dir = tmp_path / "input"
+        input_dir.mkdir()
+        pd.DataFrame({
+            "Denumire": ["Eolica Energy SRL"],
+            "Putere": ["150 MW"],
+        }).to_excel(input_dir / "furnizori.xlsx", index=False)
+
+        loader = ExcelDataLoader(str(input_dir))
+        records = loader.load_all_files(max_workers=1)
+
+        assert len(list((tmp_path / "cache").glob("*.parquet"))) == 1
+
+        loader.load_excel_file = None  # a cache hit must not re-parse the file
+        assert loader.load_all_files(max_workers=1) == records
+
+    def test_load_all_files_cache_replaces_old_entry(self, tmp_path):
+        """Test that changing a file replaces its cache entry instead of adding one."""
+        input_dir = tmp_path / "input"
+        input_dir.mkdir()
+        file_path = input_dir / "furnizori.xlsx"
+        pd.DataFrame({"Denumire": ["Eolica Energy SRL"]}).to_excel(file_path, index=False)
+
+        loader = ExcelDataLoader(str(input_dir))
+        loader.load_all_files(max_workers=1)
+        old_entry = loader._cache_path(file_path)
+
+        pd.DataFrame({"Denumire": ["Solar Power Romania", "Hidro SA"]}).to_excel(file_path, index=False)
+        records = loader.load_all_files(max_workers=1)
+
+        assert len(records) == 2
+        assert list((tmp_path / "cache").glob("*.parquet")) == [loader._cache_path(file_path)]
+        assert not old_entry.exists()
+
+    def test_cache_path_covers_cache_version(self, tmp_path, monkeypatch):
+        """Test that bumping CACHE_VERSION invalidates cached records."""
+        file_path = tmp_path / "furnizori.xlsx"
+        pd.DataFrame({"Denumire": ["Eolica Energy SRL"]}).to_excel(file_path, index=False)
+        loader = ExcelDataLoader(str(tmp_path))
+        old_path = loader._cache_path(file_path)
+
+        monkeypatch.setattr(ExcelDataLoader, "CACHE_VERSION", ExcelDataLoader.CACHE_VERSION + 1)
+
+        assert loader._cache_path(file_path) != old_path
+        assert loader._cache_path(file_path).name.split("-")[0] == old_path.name.split("-")[0]
+
+    def test_find_excel_files(self, tmp_path):
+        """Test file discovery with flat and nested patterns."""
+        (tmp_path / "sub").mkdir()
+        for name in ["a.xlsx", "b.xls", "._a.xlsx", "notes.txt", "sub/c.xlsx"]:
+            (tmp_path / name).touch()
+        (tmp_path / "dir.xlsx").mkdir()
+        loader = ExcelDataLoader(str(tmp_path))
+
+        assert sorted(p.name for p in loader.find_excel_files()) == ["a.xlsx", "b.xls"]
+        assert sorted(p.name for p in loader.find_excel_files(["*.xlsx", "sub/*.xlsx"])) == ["a.xlsx", "c.xlsx"]
+        assert sorted(p.name for p in loader.find_excel_files(["**/*.xlsx"])) == ["a.xlsx", "c.xlsx"]
+
+    def test_find_excel_files_missing_dir(self, tmp_path):
+        """Test that a missing input directory yields no files."""
+        loader = ExcelDataLoader(str(tmp_path / "missing"))
+
+        assert loader.find_excel_files() == []
+        assert loader.load_all_files() == []
+
+    def test_validate_records(self):
+        """Test batch validation splits valid and invalid records."""
+        loader = ExcelDataLoader("./data/input")
+        records = [
+            {"client_name": "Test Company", "power_installed": 100.0, "source_file": "a.xlsx"},
+            {"client_name": "Bad Power", "power_installed": "not a number", "source_file": "b.xlsx"},
+            {"source_file": "c.xlsx", "row_number": 5},
+        ]
+
+        valid, invalid = loader.validate_records(records)
+
+        assert [r.source_file for r in valid] == ["a.xlsx", "c.xlsx"]
+        assert all(isinstance(r, EnergyRecord) for r in valid)
+        assert invalid == [records[1]]
+
     def test_detect_column(self):
         """Test column detection."""
         loader = ExcelDataLoader("./data/input")
@@ -64,6 +182,21 @@ class TestExcelDataLoader:
         # Test non-existent column
         assert loader.detect_column(df, "non_existent") is None
 
+    def test_detect_columns(self):
+        """Test detecting all mapped columns in one pass."""
+        mappings = ExcelDataLoader._default_column_mappings()
+        loader = ExcelDataLoader("./data/input", column_mappings=mappings)
+
+        df = pd.DataFrame(columns=["Nr", "Denumire Companie", "Persoana Contact", "Putere (MW)"])
+
+        expected = {
+            field: loader.detect_column(df, field)
+            for field in mappings
+            if loader.detect_column(df, field) is not None
+        }
+        assert loader.detect_columns(df) == expected
+        assert expected["contact_person"] == "Persoana Contact"
+
 
 class TestEnergyRecord:
     """Tests for EnergyRecord model."""
@@ -0,0 +1,43 @@
+"""
+Unit tests for embeddings module.
+"""
+import numpy as np
+import pytest
+
+pytest.importorskip("faiss")
+
+from src.embeddings import FaissEmbeddings
+
+
+class TestFaissEmbeddings:
+    """Tests for FaissEmbeddings class."""
+
+    def test_query_save_load(self, tmp_path):
+        """Test that documents are found by cosine similarity before and after a reload."""
+        rng = np.random.default_rng(0)
+        embeddings = rng.standard_normal((200, 32)).astype(np.float32)
+        metadata = [{"client_name": f"Client {i}"} for i in range(200)]
+
+        store = FaissEmbeddings(dimension=32, persist_directory=str(tmp_path / "hnsw"))
+        store.add_documents(embeddings, metadata)
+        results = store.query(embeddings[7] * 3, n_results=3)
+
+        assert store.count() == 200
+        assert len(results) == 3
+        assert results[0]["id"] == "doc_7"
+        assert results[0]["metadata"] == {"client_name": "Client 7"}
+        assert results[0]["score"] == pytest.approx(1.0, abs=1e-5)
+
+        store.save()
+        reloaded = FaissEmbeddings(dimension=32, persist_directory=str(tmp_path / "hnsw"))
+        reloaded.load()
+
+        assert [r["id"] for r in reloaded.query(embeddings[7], n_results=3)] == [r["id"] for r in results]
+
+        reloaded.reset()
+        assert reloaded.count() == 0
+        assert reloaded.query(embeddings[7]) == []
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,57 @@
+"""
+Unit tests for rag_system module.
+"""
+import subprocess
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from src.rag_system import RAGSystem
+
+
+class TestRAGSystemImport:
+    """Tests for the import cost of the rag_system module."""
+
+    def test_import_does_not_load_numpy(self):
+        """Test that importing RAGSystem leaves numpy to the components."""
+        # A fresh interpreter, since other tests already imported numpy
+        result = subprocess.run(
+            [sys.executable, "-c", "import sys, src.rag_system; print('numpy' in sys.modules)"],
+            cwd=Path(__file__).resolve().parent.parent,
+            capture_output=True,
+            text=True,
+            check=True
+        )
+
+        assert result.stdout.strip() == "False"
+
+
+class TestRAGSystemSaveEmbeddings:
+    """Tests for writing embeddings.npy next to the index."""
+
+    def test_save_embeddings_renames_memmap(self, tmp_path, monkeypatch):
+        """Test that the memmap written by _create_embeddings is renamed, not rewritten."""
+        (tmp_path / "work").mkdir()
+        monkeypatch.chdir(tmp_path / "work")
+        # A relative path with "..", as from --embeddings-dir ../emb
+        embeddings_file = Path("..") / "emb" / "embeddings.npy"
+        embeddings_file.parent.mkdir()
+        tmp_file = embeddings_file.with_name("embeddings.npy.tmp")
+        expected = np.arange(2000 * 32, dtype=np.float32).reshape(2000, 32)
+        mapped = np.lib.format.open_memmap(tmp_file, mode="w+", dtype=np.float32, shape=expected.shape)
+        mapped[:] = expected
+
+        system = RAGSystem(embeddings_dir=str(tmp_path / "emb"))
+        system.embeddings = mapped
+        system._save_embeddings(embeddings_file)
+
+        assert not tmp_file.exists()
+        assert isinstance(system.embeddings, np.memmap)
+        assert Path(system.embeddings.filename) == (tmp_path / "emb" / "embeddings.npy").resolve()
+        np.testing.assert_array_equal(np.load(embeddings_file), expected)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,181 @@
+"""
+Unit tests for retriever module.
+"""
+import numpy as np
+import pytest
+from src.retriever import FAISSRetriever, HybridRetriever, MetadataTable
+
+
+def _embeddings(n=2000, d=32, seed=0):
+    """Random float32 embeddings."""
+    return np.random.default_rng(seed).standard_normal((n, d)).astype(np.float32)
+
+
+def _records(n=2000):
+    """Records cycling through three source types."""
+    source_types = ["Eoliana", "Solar", "Hidro"]
+    return [
+        {"client_name": f"Client {i}", "source_type": source_types[i % 3], "power_installed": float(i)}
+        for i in range(n)
+    ]
+
+
+class TestFAISSRetriever:
+    """Tests for FAISSRetriever class."""
+
+    @pytest.mark.parametrize("index_type", ["IVF", "HNSW"])
+    def test_search_leaves_index_settings(self, index_type):
+        """Test that per-search settings do not modify the shared index."""
+        retriever = FAISSRetriever(dimension=32, index_type=index_type, ef_search=16, nprobe=4)
+        embeddings = _embeddings()
+        retriever.add_embeddings(embeddings, _records())
+        settings = lambda: retriever.index.nprobe if index_type == "IVF" else retriever.index.hnsw.efSearch
+        before = settings()
+
+        results = retriever.search(embeddings[5], k=50, ef_search=64, ids=np.arange(0, 2000, 2))
+
+        assert settings() == before
+        assert len(results) == 50
+        assert all(r["index"] % 2 == 0 for r in results)
+
+        assert all(r["index"] % 2 == 0 for r in results)
+
+    @pytest.mark.parametrize("index_type, quantization", [
+        ("Flat", None),
+        ("Flat", "SQ8"),
+        ("IVF", "SQ8"),
+        ("HNSW", "SQfp16"),
+        ("IVFFastScan", None),
+        ("Binary", None),
+    ])
+    def test_index_types_save_load(self, tmp_path, index_type, quantization):
+        """Test that each index type finds stored vectors before and after a reload."""
+        retriever = FAISSRetriever(dimension=32, index_type=index_type, quantization=quantization, nprobe=8)
+        embeddings = _embeddings()
+        retriever.add_embeddings(embeddings, _records())
+        queries = embeddings[:20]
+
+        batch_results = retriever.search_batch(queries, k=10)
+        found = [results[0]["index"] for results in batch_results]
+        # Approximate and quantized indexes may miss a few of the stored vectors
+        assert sum(i in [r["index"] for r in results] for i, results in enumerate(batch_results)) >= 18
+
+        retriever.save_index(str(tmp_path / "index"))
+        reloaded = FAISSRetriever(dimension=32)
+        reloaded.load_index(str(tmp_path / "index"))
+
+        assert reloaded.index_type == index_type
+        assert reloaded.get_statistics()["total_embeddings"] == 2000
+        assert [r[0]["index"] for r in reloaded.search_batch(queries, k=10)] == found
+
+    def test_metadata_table_round_trip(self, tmp_path):
+        """Test that records with different fields survive the Parquet metadata file."""
+        records = _records(100)
+        records[3] = {"client_name": "Client 3", "raw_data": {"Putere": "5", "Judet": "Cluj"}}
+        del records[4]["power_installed"]
+        retriever = FAISSRetriever(dimension=32)
+        retriever.add_embeddings(_embeddings(100), records)
+
+        retriever.save_index(str(tmp_path / "index"))
+        retriever.load_index(str(tmp_path / "index"))
+
+        assert (tmp_path / "index" / "metadata.parquet").exists()
+        assert isinstance(retriever.metadata, MetadataTable)
+        assert len(retriever.metadata) == 100
+        assert list(retriever.metadata) == records
+        assert retriever.metadata.take([4, 3]) == [records[4], records[3]]
+        assert retriever.search(_embeddings(100)[3], k=1)[0]["metadata"] == records[3]
+
+    def test_add_after_mmap_load(self, tmp_path):
+        """Test that embeddings can be added to a memory-mapped index."""
+        embeddings = _embeddings(2100)
+        records = _records(2100)
+        retriever = FAISSRetriever(dimension=32, index_type="HNSW")
+        retriever.add_embeddings(embeddings[:2000], records[:2000])
+        retriever.save_index(str(tmp_path / "index"))
+
+        loaded = FAISSRetriever(dimension=32)
+        loaded.load_index(str(tmp_path / "index"), mmap=True)
+        assert loaded.index_mapped
+        loaded.add_embeddings(embeddings[2000:], records[2000:])
+
+        assert not loaded.index_mapped
+        assert loaded.index.ntotal == 2100
+        assert len(loaded.metadata) == 2100
+        result = loaded.search(embeddings[2050], k=1)[0]
+        assert result["index"] == 2050
+        assert result["metadata"] == records[2050]
+
+
+class TestHybridRetriever:
+    """Tests for HybridRetriever class."""
+
+    @pytest.mark.parametrize("n_results", [
+        HybridRetriever.VECTORIZED_FILTER_MIN_RESULTS - 1,
+        HybridRetriever.VECTORIZED_FILTER_MIN_RESULTS + 1,
+    ])
+    def test_filter_by_metadata_nulls(self, n_results):
+        """Test that the scalar and vectorized filter paths treat nulls alike."""
+        values = ["Eoliana", None, float("nan"), "Solar", "missing"]
+        results = []
+        for i in range(n_results):
+            metadata = {"source_type": values[i % len(values)], "power_installed": i}
+            if metadata["source_type"] == "missing":
+                del metadata["source_type"]
+            results.append({"metadata": metadata, "score": 1.0})
+        retriever = HybridRetriever(faiss_retriever=None)
+
+        def filtered(filters):
+            return [r["metadata"]["power_installed"] for r in retriever.filter_by_metadata(results, filters)]
+
+        expected_eoliana = [i for i in range(n_results) if i % len(values) == 0]
+        assert filtered({"source_type": "Eoliana"}) == expected_eoliana
+        assert filtered({"source_type": None}) == []
+        assert filtered({"source_type": [None, "Eoliana"]}) == expected_eoliana
+        assert filtered({"source_type": "Eoliana", "power_installed": {"min": 8}}) == [
+            i for i in expected_eoliana if i >= 8
+        ]
+
+    def test_prefilter_ids(self):
+        """Test the candidate ids looked up for exact and list filters."""
+        retriever = FAISSRetriever(dimension=32)
+        retriever.add_embeddings(_embeddings(), _records())
+        hybrid = HybridRetriever(retriever)
+
+        np.testing.assert_array_equal(hybrid.prefilter_ids({"source_type": "Solar"}), np.arange(1, 2000, 3))
+        np.testing.assert_array_equal(
+            hybrid.prefilter_ids({"source_type": ["Solar", "Hidro"]}),
+            [i for i in range(2000) if i % 3]
+        )
+        np.testing.assert_array_equal(
+            hybrid.prefilter_ids({"source_type": "Solar", "client_name": ["Client 1", "Client 2"]}),
+            [1]
+        )
+        assert len(hybrid.prefilter_ids({"source_type": "Geotermala"})) == 0
+        assert hybrid.prefilter_ids({"power_installed": {"min": 10}}) is None
+
+    @pytest.mark.parametrize("filters", [
+        {"source_type": "Solar"},
+        {"source_type": ["Solar", "Hidro"], "power_installed": {"min": 1000}},
+        # No id lookup: only found by doubling the number of candidates
+        {"power_installed": {"min": 1950}},
+    ])
+    def test_search_with_filters(self, filters):
+        """Test that filtered search returns the best k matching records."""
+        retriever = FAISSRetriever(dimension=32)
+        embeddings = _embeddings()
+        retriever.add_embeddings(embeddings, _records())
+        hybrid = HybridRetriever(retriever)
+        query = _embeddings(1, seed=1)[0]
+
+        results = hybrid.search_with_filters(query, k=10, filters=filters)
+
+        expected = [
+            r["index"] for r in hybrid.filter_by_metadata(retriever.search(query, k=2000), filters)
+        ][:10]
+        assert [r["index"] for r in results] == expected
+        assert len(results) == 10
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
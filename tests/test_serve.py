@@ -0,0 +1,71 @@
+"""
+Unit tests for the serve command's daemon protocol.
+"""
+import socket
+import sys
+import threading
+from multiprocessing.connection import Listener
+
+import pytest
+
+from src.commands import serve
+from src.commands.serve import _serve, _write_authkey, send_request
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="Unix socket addresses")
+
+
+class FakeRAG:
+    """Stands in for a loaded RAGSystem."""
+
+    def get_statistics(self):
+        return {"total_documents": 3}
+
+
+@pytest.fixture
+def daemon(tmp_path, monkeypatch):
+    """Serve FakeRAG for tmp_path on a socket in tmp_path."""
+    monkeypatch.setattr(serve, "CLIENT_TIMEOUT", 0.5)
+    address = str(tmp_path / "d.sock")
+    authkey = _write_authkey(address)
+    listener = Listener(address)
+    threading.Thread(
+        target=_serve,
+        args=(listener, authkey, FakeRAG(), str(tmp_path.resolve())),
+        daemon=True
+    ).start()
+    yield address
+    listener.close()
+
+
+class TestServe:
+    """Tests for send_request against a running daemon loop."""
+
+    def test_round_trip(self, tmp_path, daemon):
+        """Test that a client holding the key gets the daemon's answer."""
+        assert send_request(str(tmp_path), "stats", address=daemon) == {"total_documents": 3}
+
+    def test_embeddings_dir_mismatch(self, tmp_path, daemon):
+        """Test that a daemon serving another directory is not used."""
+        assert send_request(str(tmp_path / "other"), "stats", address=daemon) is None
+
+    def test_wrong_key(self, tmp_path, daemon):
+        """Test that a client with the wrong key is rejected and the daemon keeps serving."""
+        key_file = tmp_path / "d.sock.key"
+        authkey = key_file.read_bytes()
+        key_file.write_bytes(b"x" * len(authkey))
+
+        assert send_request(str(tmp_path), "stats", address=daemon) is None
+
+        key_file.write_bytes(authkey)
+        assert send_request(str(tmp_path), "stats", address=daemon) == {"total_documents": 3}
+
+    def test_stalled_client(self, tmp_path, daemon):
+        """Test that a client that connects and never answers does not block the daemon."""
+        with socket.socket(socket.AF_UNIX) as stalled:
+            stalled.connect(daemon)
+
+            assert send_request(str(tmp_path), "stats", address=daemon) == {"total_documents": 3}
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])